@@ -20,6 +20,8 @@ import time
 from unittest.mock import MagicMock
 
 from longevity_test import LongevityTest
+from sdcm import wait
+from sdcm.exceptions import WaitForTimeoutError
 from sdcm.sct_events import Severity
 from sdcm.sct_events.health import DataValidatorEvent
 from sdcm.utils.data_validator import LongevityDataValidator
@@ -48,9 +50,6 @@ class LWTLongevityTest(LongevityTest):
         if self.db_cluster.nemesis_threads:
             self.db_cluster.stop_nemesis(timeout=300)
 
-        # Wait for MVs data will be fully inserted (running on background)
-        time.sleep(300)
-
         # Data validation can be run when no nemesis, that almost not happens in case of parallel nemesis.
         # If we even will catch period when no nemesis are running, it may happen that the nemesis will start in the
         # middle of data validation and fail it
@@ -60,11 +59,19 @@ class LWTLongevityTest(LongevityTest):
             DataValidatorEvent.DataValidator(severity=Severity.NORMAL,
                                              message="Test runs with parallel nemesis. Data validator is disabled."
                                              ).publish()
+            # Views to wait for are unknown without the data validator, so give MVs the fixed time to be built
+            time.sleep(300)
         else:
             self.data_validator = LongevityDataValidator(longevity_self_object=self,
                                                          user_profile_name='c-s_lwt',
                                                          base_table_partition_keys=self.BASE_TABLE_PARTITION_KEYS)
 
+            # Wait for MVs data will be fully inserted (running on background)
+            if keyspace := self.data_validator.keyspace_name:
+                self._wait_for_mv_build(keyspace_name=keyspace)
+            else:
+                time.sleep(300)
+
             self.data_validator.copy_immutable_expected_data()
             self.data_validator.copy_updated_expected_data()
             self.data_validator.save_count_rows_for_deletion()
@@ -73,6 +80,33 @@ class LWTLongevityTest(LongevityTest):
         if self.params.get('nemesis_during_prepare'):
             self.start_nemesis()
 
+    def _wait_for_mv_build(self, keyspace_name, timeout=300, poll=10):
+        """Wait until all views used by the data validator report SUCCESS build status, up to `timeout` seconds"""
+        view_names = {*self.data_validator.view_names_for_updated_data,
+                      *self.data_validator.view_names_after_updated_data,
+                      self.data_validator.view_name_for_not_updated_data,
+                      self.data_validator.view_name_for_deletion_data} - {None}
+
+        def _views_are_built():
+            for view_name in view_names:
+                statuses = [row.status for row in session.execute(
+                    "SELECT status FROM system_distributed.view_build_status WHERE keyspace_name=%s AND view_name=%s",
+                    (keyspace_name, view_name))]
+                self.log.debug("View build statuses of %s.%s: %s", keyspace_name, view_name, statuses)
+                if not statuses or any(status != 'SUCCESS' for status in statuses):
+                    return False
+            return True
+
+        with self.db_cluster.cql_connection_patient(self.db_cluster.nodes[0]) as session:
+            try:
+                wait.wait_for(_views_are_built, step=poll, timeout=timeout,
+                              text=f"Waiting for materialized views of {keyspace_name} to be built")
+            except WaitForTimeoutError:
+                DataValidatorEvent.DataValidator(
+                    severity=Severity.WARNING,
+                    message=f"Materialized views {sorted(view_names)} of {keyspace_name} are not built "
+                            f"after {timeout} seconds. Data validation may fail.").publish()
+
     def start_nemesis(self):
         self.db_cluster.start_nemesis()
 
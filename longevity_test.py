@@ -104,7 +104,7 @@ class LongevityTest(ClusterTester, loader_utils.LoaderUtilsMixin):
 
     @optional_stage('main_load')
     def _run_validate_large_collections_in_system(self, node, table='table_with_large_collection'):
-        self.log.info("Verifying large collections in system tables on node: {}".format(node))
+        self.log.info("Verifying large collections in system tables on node: %s", node)
         with self.db_cluster.cql_connection_exclusive(node=node) as session:
             query = "SELECT * from system.large_cells WHERE keyspace_name='large_collection_test'" \
                     f" AND table_name='{table}' ALLOW FILTERING"
@@ -115,7 +115,7 @@ class LongevityTest(ClusterTester, loader_utils.LoaderUtilsMixin):
 
     @optional_stage('main_load')
     def _run_validate_large_collections_warning_in_logs(self, node):
-        self.log.info("Verifying warning for large collections in logs on node: {}".format(node))
+        self.log.info("Verifying warning for large collections in logs on node: %s", node)
         msg = "Writing large collection"
         res = list(node.follow_system_log(patterns=[msg], start_from_beginning=True))
         if not res:
@@ -182,20 +182,19 @@ class LongevityTest(ClusterTester, loader_utils.LoaderUtilsMixin):
         customer_profiles = self.params.get('cs_user_profiles')
         if customer_profiles:
             cs_duration = self.params.get('cs_duration')
+            user_profile_table_count = self.params.get('user_profile_table_count')  # pylint: disable=invalid-name
             for cs_profile in customer_profiles:
                 cs_profile = sct_abs_path(cs_profile)  # noqa: PLW2901
                 assert os.path.exists(cs_profile), 'File not found: {}'.format(cs_profile)
-                self.log.debug('Run stress test with user profile {}, duration {}'.format(cs_profile, cs_duration))
+                self.log.debug('Run stress test with user profile %s, duration %s', cs_profile, cs_duration)
                 profile_dst = os.path.join('/tmp', os.path.basename(cs_profile))
                 with open(cs_profile, encoding="utf-8") as pconf:
                     cont = pconf.readlines()
-                    user_profile_table_count = self.params.get(  # pylint: disable=invalid-name
-                        'user_profile_table_count')
                     for _ in range(user_profile_table_count):
                         for cmd in [line.lstrip('#').strip() for line in cont if line.find('cassandra-stress') > 0]:
                             stress_cmd = (cmd.format(profile_dst, cs_duration))
                             params = {'stress_cmd': stress_cmd, 'profile': cs_profile}
-                            self.log.debug('Stress cmd: {}'.format(stress_cmd))
+                            self.log.debug('Stress cmd: %s', stress_cmd)
                             if not skip_optional_stage('main_load'):
                                 self._run_all_stress_cmds(stress_queue, params)
 
@@ -297,13 +296,12 @@ class LongevityTest(ClusterTester, loader_utils.LoaderUtilsMixin):
         if customer_profiles:
             cs_duration = self.params.get('cs_duration')
             duration = int(cs_duration.translate(str.maketrans('', '', string.ascii_letters)))
+            user_profile_table_count = self.params.get('user_profile_table_count')  # pylint: disable=invalid-name
 
             for cs_profile in customer_profiles:
                 cs_profile = sct_abs_path(cs_profile)  # noqa: PLW2901
                 assert os.path.exists(cs_profile), 'File not found: {}'.format(cs_profile)
-                self.log.debug('Run stress test with user profile {}, duration {}'.format(cs_profile, cs_duration))
-
-                user_profile_table_count = self.params.get('user_profile_table_count')  # pylint: disable=invalid-name
+                self.log.debug('Run stress test with user profile %s, duration %s', cs_profile, cs_duration)
 
                 for _ in range(user_profile_table_count):
                     stress_params_list += self.create_templated_user_stress_params(next(templated_table_counter),
@@ -407,13 +405,13 @@ class LongevityTest(ClusterTester, loader_utils.LoaderUtilsMixin):
         cassandra-stress.
         """
 
-        self.log.debug('Pre Creating Schema for c-s with {} keyspaces'.format(keyspace_num))
+        self.log.debug('Pre Creating Schema for c-s with %s keyspaces', keyspace_num)
         compaction_strategy = self.params.get('compaction_strategy')
         sstable_size = self.params.get('sstable_size')
         for i in range(1, keyspace_num+1):
             keyspace_name = 'keyspace{}'.format(i)
             self.create_keyspace(keyspace_name=keyspace_name, replication_factor=3)
-            self.log.debug('{} Created'.format(keyspace_name))
+            self.log.debug('%s Created', keyspace_name)
             col_num = self._get_prepare_write_cmd_columns_num() or 5
             columns = {}
             for col_idx in range(col_num):
@@ -444,28 +442,28 @@ class LongevityTest(ClusterTester, loader_utils.LoaderUtilsMixin):
                 try:
                     session.execute(keyspace_definition)
                 except AlreadyExists:
-                    self.log.debug("keyspace [{}] exists".format(keyspace_name))
+                    self.log.debug("keyspace [%s] exists", keyspace_name)
 
                 if batch_start is not None and batch_end is not None:
                     table_range = range(batch_start, batch_end)
                 else:
                     table_range = range(user_profile_table_count)
-                self.log.debug('Pre Creating Schema for c-s with {} user tables'.format(user_profile_table_count))
+                self.log.debug('Pre Creating Schema for c-s with %s user tables', user_profile_table_count)
                 for i in table_range:
                     table_name = 'table{}'.format(i)
                     query = table_template.substitute(table_name=table_name)
                     try:
                         session.execute(query)
                     except AlreadyExists:
-                        self.log.debug('table [{}] exists'.format(table_name))
-                    self.log.debug('{} Created'.format(table_name))
+                        self.log.debug('table [%s] exists', table_name)
+                    self.log.debug('%s Created', table_name)
 
                     for definition in profile_yaml.get('extra_definitions', []):
                         query = string.Template(definition).substitute(table_name=table_name)
                         try:
                             session.execute(query)
                         except (AlreadyExists, InvalidRequest) as exc:
-                            self.log.debug('extra definition for [{}] exists [{}]'.format(table_name, str(exc)))
+                            self.log.debug('extra definition for [%s] exists [%s]', table_name, exc)
 
     def _flush_all_nodes(self):
         """
@@ -515,7 +513,7 @@ class LongevityTest(ClusterTester, loader_utils.LoaderUtilsMixin):
             for cmd in [line.lstrip('#').strip() for line in cont if line.find('cassandra-stress') > 0]:
                 stress_cmd = cmd.format(profile_dst, cs_duration)
                 params = {'stress_cmd': stress_cmd, 'profile': profile_dst}
-                self.log.debug('Stress cmd: {}'.format(stress_cmd))
+                self.log.debug('Stress cmd: %s', stress_cmd)
                 params_list.append(params)
 
         return params_list
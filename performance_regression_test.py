@@ -33,6 +33,36 @@ from sdcm.utils.hdrhistogram import CSHistogramTagTypes
 from sdcm.utils.nemesis_utils.indexes import wait_for_view_to_be_built
 
 KB = 1024
+TEST_XML_TEMPLATE = """
+  <test name="{test_name}: ({loader_idx}) Loader{loader_idx} CPU{cpu_idx} Keyspace{keyspace_idx}" executed="yes">
+    <description>"{test_name} test, ami_id: {ami_id}, scylla version:
+    {ami_desc}", hardware: {instance_type}</description>
+    <targets>
+      <target threaded="yes">target-ami_id-{ami_id}</target>
+      <target threaded="yes">target-version-{ami_desc}</target>
+    </targets>
+    <platform name="AWS platform">
+      <hardware>{instance_type}</hardware>
+    </platform>
+
+    <result>
+      <success passed="yes" state="1"/>
+      <performance unit="kbs" mesure="{op_rate}" isRelevant="true" />
+      <metrics>
+        <op-rate unit="op/s" mesure="{op_rate}" isRelevant="true" />
+        <partition-rate unit="pk/s" mesure="{partition_rate}" isRelevant="true" />
+        <row-rate unit="row/s" mesure="{row_rate}" isRelevant="true" />
+        <latency-mean unit="mean" mesure="{latency_mean}" isRelevant="true" />
+        <latency-median unit="med" mesure="{latency_median}" isRelevant="true" />
+        <l-95th-pct unit=".95" mesure="{latency_95th}" isRelevant="true" />
+        <l-99th-pct unit=".99" mesure="{latency_99th}" isRelevant="true" />
+        <l-99.9th-pct unit=".999" mesure="{latency_999th}" isRelevant="true" />
+        <total_partitions unit="total_partitions" mesure="{total_partitions}" isRelevant="true" />
+        <total_errors unit="total_errors" mesure="{total_errors}" isRelevant="true" />
+      </metrics>
+    </result>
+  </test>
+"""
 
 
 class PerformanceTestWorkload(Enum):
@@ -63,6 +93,7 @@ class PerformanceRegressionTest(ClusterTester):  # pylint: disable=too-many-publ
         # emails for each test. When we move to use SCT Runners, it won't be necessary.
         self._clean_email_data()
         super().__init__(*args)
+        self._test_xml_context = None
 
     @teardown_on_exception
     @log_run_info
@@ -106,60 +137,33 @@ class PerformanceRegressionTest(ClusterTester):  # pylint: disable=too-many-publ
                       result['total partitions'],
                       result['total errors'])
 
-    def get_test_xml(self, result, test_name=''):
-        test_content = """
-  <test name="%s: (%s) Loader%s CPU%s Keyspace%s" executed="yes">
-    <description>"%s test, ami_id: %s, scylla version:
-    %s", hardware: %s</description>
-    <targets>
-      <target threaded="yes">target-ami_id-%s</target>
-      <target threaded="yes">target-version-%s</target>
-    </targets>
-    <platform name="AWS platform">
-      <hardware>%s</hardware>
-    </platform>
+    def _get_test_xml_context(self):
+        if self._test_xml_context is None:
+            self._test_xml_context = {
+                'ami_id': self.params.get('ami_id_db_scylla'),
+                'ami_desc': self.params.get('ami_id_db_scylla_desc'),
+                'instance_type': self.params.get('instance_type_db'),
+            }
+        return self._test_xml_context
 
-    <result>
-      <success passed="yes" state="1"/>
-      <performance unit="kbs" mesure="%s" isRelevant="true" />
-      <metrics>
-        <op-rate unit="op/s" mesure="%s" isRelevant="true" />
-        <partition-rate unit="pk/s" mesure="%s" isRelevant="true" />
-        <row-rate unit="row/s" mesure="%s" isRelevant="true" />
-        <latency-mean unit="mean" mesure="%s" isRelevant="true" />
-        <latency-median unit="med" mesure="%s" isRelevant="true" />
-        <l-95th-pct unit=".95" mesure="%s" isRelevant="true" />
-        <l-99th-pct unit=".99" mesure="%s" isRelevant="true" />
-        <l-99.9th-pct unit=".999" mesure="%s" isRelevant="true" />
-        <total_partitions unit="total_partitions" mesure="%s" isRelevant="true" />
-        <total_errors unit="total_errors" mesure="%s" isRelevant="true" />
-      </metrics>
-    </result>
-  </test>
-""" % (test_name, result['loader_idx'],
-            result['loader_idx'],
-            result['cpu_idx'],
-            result['keyspace_idx'],
-            test_name,
-            self.params.get('ami_id_db_scylla'),
-            self.params.get('ami_id_db_scylla_desc'),
-            self.params.get('instance_type_db'),
-            self.params.get('ami_id_db_scylla'),
-            self.params.get('ami_id_db_scylla_desc'),
-            self.params.get('instance_type_db'),
-            result['op rate'],
-            result['op rate'],
-            result['partition rate'],
-            result['row rate'],
-            result['latency mean'],
-            result['latency median'],
-            result['latency 95th percentile'],
-            result['latency 99th percentile'],
-            result['latency 99.9th percentile'],
-            result['total partitions'],
-            result['total errors'])
-
-        return test_content
+    def get_test_xml(self, result, test_name=''):
+        return TEST_XML_TEMPLATE.format_map({
+            **self._get_test_xml_context(),
+            'test_name': test_name,
+            'loader_idx': result['loader_idx'],
+            'cpu_idx': result['cpu_idx'],
+            'keyspace_idx': result['keyspace_idx'],
+            'op_rate': result['op rate'],
+            'partition_rate': result['partition rate'],
+            'row_rate': result['row rate'],
+            'latency_mean': result['latency mean'],
+            'latency_median': result['latency median'],
+            'latency_95th': result['latency 95th percentile'],
+            'latency_99th': result['latency 99th percentile'],
+            'latency_999th': result['latency 99.9th percentile'],
+            'total_partitions': result['total partitions'],
+            'total_errors': result['total errors'],
+        })
 
     def display_results(self, results, test_name=''):
         self.log.info(self.str_pattern, 'op-rate', 'partition-rate',
@@ -168,18 +172,16 @@ class PerformanceRegressionTest(ClusterTester):  # pylint: disable=too-many-publ
                       'l-99th-pct', 'l-99.9th-pct',
                       'total-partitions', 'total-err')
 
-        test_xml = ""
         try:
-            for single_result in results:
-                self.display_single_result(single_result)
-                test_xml += self.get_test_xml(single_result, test_name=test_name)
-
             with open(os.path.join(self.logdir, 'jenkins_perf_PerfPublisher.xml'), 'w', encoding="utf-8") as pref_file:
-                content = """<report name="%s report" categ="none">%s</report>""" % (test_name, test_xml)
-                pref_file.write(content)
+                pref_file.write(f'<report name="{test_name} report" categ="none">')
+                for single_result in results:
+                    self.display_single_result(single_result)
+                    pref_file.write(self.get_test_xml(single_result, test_name=test_name))
+                pref_file.write('</report>')
         except Exception as ex:  # pylint: disable=broad-except  # noqa: BLE001
-            self.log.debug('Failed to display results: {0}'.format(results))
-            self.log.debug('Exception: {0}'.format(ex))
+            self.log.debug('Failed to display results: %s', results)
+            self.log.debug('Exception: %s', ex)
 
     def _workload(self, stress_cmd, stress_num, test_name, sub_type=None, keyspace_num=1, prefix='', debug_message='',  # pylint: disable=too-many-arguments
                   save_stats=True):
@@ -197,7 +199,7 @@ class PerformanceRegressionTest(ClusterTester):  # pylint: disable=too-many-publ
             self.display_results(results, test_name=test_name)
             self.check_regression()
             total_ops = self._get_total_ops()
-            self.log.debug('Total ops: {}'.format(total_ops))
+            self.log.debug('Total ops: %s', total_ops)
             return total_ops
         return None
 
@@ -226,31 +228,23 @@ class PerformanceRegressionTest(ClusterTester):  # pylint: disable=too-many-publ
             # create new document in ES with doc_id = test_id + timestamp
             # allow to correctly save results for future compare
             self.create_test_stats(sub_type='write-prepare', doc_id_with_timestamp=True)
-            stress_queue = []
-            params = {'prefix': 'preload-'}
-            # Check if the prepare_cmd is a list of commands
-            if isinstance(prepare_write_cmd, list):
-                if len(prepare_write_cmd) == 1:
-                    prepare_write_cmd = prepare_write_cmd[0]
-            if isinstance(prepare_write_cmd, list):
+            prepare_write_cmds = prepare_write_cmd if isinstance(prepare_write_cmd, list) else [prepare_write_cmd]
+            params = {'prefix': 'preload-', 'stress_num': 1, 'stats_aggregate_cmds': False}
+            # Round robin and compaction strategy are relevant only when there are several commands
+            if len(prepare_write_cmds) > 1:
                 # Check if it should be round_robin across loaders
                 if self.params.get('round_robin'):
                     self.log.debug('Populating data using round_robin')
-                    params.update({'stress_num': 1, 'round_robin': True})
+                    params['round_robin'] = True
                 if compaction_strategy:
                     self.log.debug('Next compaction strategy will be used %s', compaction_strategy)
                     params['compaction_strategy'] = compaction_strategy
 
-                for stress_cmd in prepare_write_cmd:
-                    params.update({'stress_cmd': stress_cmd})
-                    # Run all stress commands
-                    params.update(dict(stats_aggregate_cmds=False))
-                    self.log.debug('RUNNING stress cmd: {}'.format(stress_cmd))
-                    stress_queue.append(self.run_stress_thread(**params))
-            # One stress cmd command
-            else:
-                stress_queue.append(self.run_stress_thread(stress_cmd=prepare_write_cmd, stress_num=1,
-                                                           prefix='preload-', stats_aggregate_cmds=False))
+            # Every stress command runs in its own background thread, so all of them are started before waiting
+            stress_queue = []
+            for stress_cmd in prepare_write_cmds:
+                self.log.debug('RUNNING stress cmd: %s', stress_cmd)
+                stress_queue.append(self.run_stress_thread(stress_cmd=stress_cmd, **params))
 
             for stress in stress_queue:
                 self.get_stress_results(queue=stress, store_results=False)
@@ -348,12 +342,12 @@ class PerformanceRegressionTest(ClusterTester):  # pylint: disable=too-many-publ
             base_table_name = 'standard1'
             if not on_populated:
                 # Truncate base table before materialized view creation
-                self.log.debug('Truncate base table: {0}.{1}'.format(ks_name, base_table_name))
+                self.log.debug('Truncate base table: %s.%s', ks_name, base_table_name)
                 self.truncate_cf(ks_name, base_table_name, session)
 
             # Create materialized view
             view_name = base_table_name + '_mv'
-            self.log.debug('Create materialized view: {0}.{1}'.format(ks_name, view_name))
+            self.log.debug('Create materialized view: %s.%s', ks_name, view_name)
             self.create_materialized_view(ks_name, base_table_name, view_name, ['"C0"'], ['key'], session,
                                           mv_columns=['"C0"', 'key'])
 
@@ -466,7 +460,7 @@ class PerformanceRegressionTest(ClusterTester):  # pylint: disable=too-many-publ
                                        self.ops_threshold_prc / 100))
 
     def assert_mv_performance(self, ops_without_mv, ops_with_mv, failure_message):
-        self.log.debug('Performance results. Ops without MV: {0}; Ops with MV: {1}'.format(ops_without_mv, ops_with_mv))
+        self.log.debug('Performance results. Ops without MV: %s; Ops with MV: %s', ops_without_mv, ops_with_mv)
         self.assertLessEqual(ops_without_mv, (ops_with_mv * self.ops_threshold_prc) / 100, failure_message)
 
     def _scylla_bench_prepare_table(self):
@@ -643,16 +637,16 @@ class PerformanceRegressionTest(ClusterTester):  # pylint: disable=too-many-publ
         5. Drop MV
         """
         def run_workload(stress_cmd, user_profile):
-            self.log.debug('Run stress test with user profile {}'.format(user_profile))
+            self.log.debug('Run stress test with user profile %s', user_profile)
             assert os.path.exists(user_profile), 'File not found: {}'.format(user_profile)
-            self.log.debug('Stress cmd: {}'.format(stress_cmd))
+            self.log.debug('Stress cmd: %s', stress_cmd)
             stress_queue = self.run_stress_thread(stress_cmd=stress_cmd, stress_num=1, profile=user_profile,
                                                   stats_aggregate_cmds=False)
             results = self.get_stress_results(queue=stress_queue)
             self.update_test_details(scylla_conf=True)
             self.display_results(results, test_name=test_name)
             self.check_regression()
-            self.log.debug('Finish stress test with user profile {}'.format(user_profile))
+            self.log.debug('Finish stress test with user profile %s', user_profile)
 
         def get_mv_name(user_profile):
 
@@ -675,23 +669,23 @@ class PerformanceRegressionTest(ClusterTester):  # pylint: disable=too-many-publ
 
         def drop_mv(mv_name):
             # drop MV
-            self.log.debug('Start dropping materialized view {}'.format(mv_name))
+            self.log.debug('Start dropping materialized view %s', mv_name)
             query = 'drop materialized view {}'.format(mv_name)
 
             try:
                 with self.db_cluster.cql_connection_patient_exclusive(self.db_cluster.nodes[0], connect_timeout=300) as session:
-                    self.log.debug('Run query: {}'.format(query))
+                    self.log.debug('Run query: %s', query)
                     session.execute(SimpleStatement(query), timeout=300)
                     session.execute(query)
             except Exception as ex:
-                self.log.debug('Failed to drop materialized view using query {0}. Error: {1}'.format(query, str(ex)))
+                self.log.debug('Failed to drop materialized view using query %s. Error: %s', query, ex)
                 raise
 
-            self.log.debug('Finish dropping materialized view {}'.format(mv_name))
+            self.log.debug('Finish dropping materialized view %s', mv_name)
 
         test_name = 'test_mv_write'
         duration = self.params.get('test_duration')
-        self.log.debug('Start materialized views performance test. Test duration {} minutes'.format(duration))
+        self.log.debug('Start materialized views performance test. Test duration %s minutes', duration)
         self.create_test_stats()
         cmd_no_mv = self.params.get('stress_cmd_no_mv')
         cmd_no_mv_profile = self.params.get('stress_cmd_no_mv_profile')
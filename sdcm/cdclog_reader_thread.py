@@ -12,6 +12,7 @@
 # Copyright (c) 2020 ScyllaDB
 
 import logging
+import re
 import uuid
 import pprint
 from pathlib import Path
@@ -27,6 +28,22 @@ LOGGER = logging.getLogger(__name__)
 
 PP = pprint.PrettyPrinter(indent=2)
 
+CDCREADER_CS_KEYS_MAP = {
+    # {"num rows read": ["num rows read"]},
+    "rows read/s": ["partition rate", "row rate"],
+    "polls/s": ["op rate"],
+    "latency min": ["latency min"],
+    "latency avg": ["latency mean"],
+    "latency median": ["latency median"],
+    "latency 90%": ["latency 90th percentile"],
+    "latency 99%": ["latency 99th percentile"],
+    "latency 99.9%": ["latency 99.9th percentile"],
+    "latency max": ["latency max"],
+}
+CDCREADER_RESULTS_REGEX = re.compile(
+    r"^\s*(?P<name>rows read/s|polls/s|latency (?:min|avg|median|90%|99%|99\.9%|max)):\s*(?P<value>[^\s/]+)",
+    re.MULTILINE)
+
 
 class CDCLogReaderThread(DockerBasedStressThread):
     DOCKER_IMAGE_PARAM_NAME = "stress_image.cdc-stresser"
@@ -107,9 +124,9 @@ class CDCLogReaderThread(DockerBasedStressThread):
         return None
 
     @staticmethod
-    def _parse_cdcreaderstressor_results(lines: List[str]) -> Dict:
+    def _parse_cdcreaderstressor_results(output: str) -> Dict:
         """parse result of cdcreader results
-        lines:
+        output:
             Results:
             num rows read:  95185
             rows read/s:    528.805556/s
@@ -133,37 +150,11 @@ class CDCLogReaderThread(DockerBasedStressThread):
             }
 
         """
-        cdcreader_cs_keys_map = {
-            # {"num rows read": ["num rows read"]},
-            "rows read/s": ["partition rate", "row rate"],
-            "polls/s": ["op rate"],
-            "latency min": ["latency min"],
-            "latency avg": ["latency mean"],
-            "latency median": ["latency median"],
-            "latency 90%": ["latency 90th percentile"],
-            "latency 99%": ["latency 99th percentile"],
-            "latency 99.9%": ["latency 99.9th percentile"],
-            "latency max": ["latency max"],
-        }
         result = {}
-        parse_enable = False
-        for line in lines:
-            if line.startswith("Results:"):
-                parse_enable = True
-            if not parse_enable:
-                continue
-            res = line.split(":")
-            if len(res) < 2:
-                continue
-            name = res[0].strip()
-            value = res[1].strip()
-            if name in cdcreader_cs_keys_map:
-                if name in ["rows read/s", "polls/s"]:
-                    for replace_name in cdcreader_cs_keys_map[name]:
-                        result[replace_name] = value.split("/")[0]
-                else:
-                    for replace_name in cdcreader_cs_keys_map[name]:
-                        result[replace_name] = value.split(" ")[0]
+        _, _, tail = output.partition("Results:")
+        for match in CDCREADER_RESULTS_REGEX.finditer(tail):
+            for replace_name in CDCREADER_CS_KEYS_MAP[match.group("name")]:
+                result[replace_name] = match.group("value")
         LOGGER.debug(result)
         return result
 
@@ -192,10 +183,11 @@ class CDCLogReaderThread(DockerBasedStressThread):
         res_stats = []
 
         results = super().get_results()
-        LOGGER.debug(PP.pformat(results))
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(PP.pformat(results))
 
         for result in results:
-            res = self._parse_cdcreaderstressor_results(result.stdout.splitlines())
+            res = self._parse_cdcreaderstressor_results(result.stdout)
 
             if not res:
                 LOGGER.warning("Result is empty")
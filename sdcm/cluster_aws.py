@@ -36,7 +36,7 @@ from mypy_boto3_ec2.service_resource import EC2ServiceResource
 
 from sdcm import ec2_client, cluster, wait
 from sdcm.ec2_client import CreateSpotInstancesError
-from sdcm.provision.aws.utils import configure_set_preserve_hostname_script
+from sdcm.provision.aws.utils import configure_set_preserve_hostname_script, sort_by_index
 from sdcm.provision.common.utils import configure_hosts_set_hostname_script
 from sdcm.provision.network_configuration import NetworkInterface, ScyllaNetworkConfiguration, is_ip_ssh_connections_ipv6, \
     network_interfaces_count, ssh_connection_ip_type
@@ -340,11 +340,6 @@ class AWSCluster(cluster.BaseCluster):  # pylint: disable=too-many-instance-attr
                                      region_name=self.region_names[dc_idx], group_as_region=True, availability_zone=availability_zone)
         instances = results[self.region_names[dc_idx]]
 
-        def sort_by_index(item):
-            for tag in item['Tags']:
-                if tag['Key'] == 'NodeIndex':
-                    return tag['Value']
-            return '0'
         instances = sorted(instances, key=sort_by_index)
         return [ec2.get_instance(instance['InstanceId']) for instance in instances]
 
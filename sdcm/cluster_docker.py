@@ -21,6 +21,7 @@ from functools import cached_property
 
 from sdcm import cluster
 from sdcm.remote import LOCALRUNNER
+from sdcm.utils.common import ParallelObject, ParallelObjectException
 from sdcm.utils.docker_utils import get_docker_bridge_gateway, Container, ContainerManager, DockerException
 from sdcm.utils.health_checker import check_nodes_status
 from sdcm.utils.net import get_my_public_ip
@@ -253,8 +254,10 @@ class DockerCluster(cluster.BaseCluster):  # pylint: disable=abstract-method
         if container is None:
             ContainerManager.build_container_image(node, "node")
 
-        ContainerManager.run_container(node, "node", seed_ip=self.nodes[0].public_ip_address if node_index else None)
-        ContainerManager.wait_for_status(node, "node", status="running")
+        container = ContainerManager.run_container(
+            node, "node", seed_ip=self.nodes[0].public_ip_address if node_index else None)
+        if container.status != "running":  # reused containers are usually running already
+            ContainerManager.wait_for_status(node, "node", status="running")
         ContainerManager.ssh_copy_id(node, "node", self.node_container_user, self.node_container_key_file)
 
         node.init()
@@ -267,12 +270,24 @@ class DockerCluster(cluster.BaseCluster):  # pylint: disable=abstract-method
         return sorted(set(range(len(self.nodes) + count)) - set(node.node_index for node in self.nodes))
 
     def _create_nodes(self, count, enable_auto_bootstrap=False):
+        node_indexes = self._get_new_node_indexes(count)
         new_nodes = []
-        for node_index in self._get_new_node_indexes(count):
-            node = self._create_node(node_index)
-            node.enable_auto_bootstrap = enable_auto_bootstrap
+        if not self.nodes and node_indexes:
+            # The first node builds the node image and is the seed for the rest, so create it before others.
+            node = self._create_node(node_indexes.pop(0))
             self.nodes.append(node)
             new_nodes.append(node)
+        if node_indexes:
+            results = ParallelObject(objects=node_indexes, timeout=None, num_workers=min(len(node_indexes), 16)).run(
+                self._create_node, ignore_exceptions=True)
+            # Keep track of every node created, even if others failed, so destroy() removes their containers.
+            created_nodes = [result.result for result in results if not result.exc]
+            self.nodes.extend(created_nodes)
+            new_nodes.extend(created_nodes)
+            if any(result.exc for result in results):
+                raise ParallelObjectException(results=results)
+        for node in new_nodes:
+            node.enable_auto_bootstrap = enable_auto_bootstrap
         return new_nodes
 
     def _get_nodes(self):
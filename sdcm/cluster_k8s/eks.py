@@ -41,6 +41,7 @@ from sdcm.cluster_k8s import (
     SCYLLA_AGENT_CONFIG_NAME,
     SCYLLA_NAMESPACE,
 )
+from sdcm.provision.aws.utils import sort_by_index
 from sdcm.remote import LOCALRUNNER
 from sdcm.utils.aws_utils import (
     get_arch_from_instance_type,
@@ -839,11 +840,6 @@ class MonitorSetEKS(MonitorSetAWS):
         )
         instances = results[self.region_names[dc_idx]]
 
-        def sort_by_index(item):
-            for tag in item['Tags']:
-                if tag['Key'] == 'NodeIndex':
-                    return tag['Value']
-            return '0'
         instances = sorted(instances, key=sort_by_index)
         return [ec2.get_instance(instance['InstanceId']) for instance in instances]
 
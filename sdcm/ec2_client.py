@@ -2,6 +2,7 @@ import logging
 import datetime
 import time
 import base64
+from copy import deepcopy
 
 import boto3
 from mypy_boto3_ec2 import EC2Client, EC2ServiceResource
@@ -22,6 +23,7 @@ FLEET_LIMIT_EXCEEDED_ERROR = 'spotInstanceCountLimitExceeded'
 SPOT_CAPACITY_NOT_AVAILABLE_ERROR = 'capacity-not-available'
 MAX_SPOT_EXCEEDED_ERROR = 'MaxSpotInstanceCountExceeded'
 REQUEST_TIMEOUT = 300
+_SUBNETS_INFO = {}
 
 
 class GetSpotPriceHistoryError(Exception):
@@ -347,8 +349,12 @@ class EC2ClientWrapper():
         self._client.terminate_instances(InstanceIds=instance_ids)
 
     def get_subnet_info(self, subnet_id):
-        resp = self._client.describe_subnets(SubnetIds=[subnet_id])
-        return [subnet for subnet in resp['Subnets'] if subnet['SubnetId'] == subnet_id][0]
+        # subnets don't change during a run, so describe each of them once for all the wrapper instances
+        key = (self._client.meta.region_name, subnet_id)
+        if key not in _SUBNETS_INFO:
+            resp = self._client.describe_subnets(SubnetIds=[subnet_id])
+            _SUBNETS_INFO[key] = [subnet for subnet in resp['Subnets'] if subnet['SubnetId'] == subnet_id][0]
+        return deepcopy(_SUBNETS_INFO[key])
 
     def get_instance_by_private_ip(self, private_ip):
         """
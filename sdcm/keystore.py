@@ -15,6 +15,7 @@ import os
 import json
 import hashlib
 import threading
+from functools import lru_cache
 from typing import BinaryIO
 from concurrent.futures.thread import ThreadPoolExecutor
 from collections import namedtuple
@@ -22,7 +23,6 @@ from collections import namedtuple
 import boto3
 import paramiko
 from mypy_boto3_s3.client import S3Client
-from mypy_boto3_s3.service_resource import S3ServiceResource
 
 KEYSTORE_S3_BUCKET = "scylla-qa-keystore"
 
@@ -31,27 +31,34 @@ SSHKey = namedtuple("SSHKey", ["name", "public_key", "private_key"])
 BOTO3_CLIENT_CREATION_LOCK = threading.Lock()
 
 
-class KeyStore:  # pylint: disable=too-many-public-methods
-    @property
-    def s3(self) -> S3ServiceResource:
-        return boto3.resource("s3")
+@lru_cache(maxsize=None)
+def _get_s3_client() -> S3Client:
+    with BOTO3_CLIENT_CREATION_LOCK:
+        return boto3.client("s3")
+
 
+@lru_cache(maxsize=None)
+def _get_file_contents(file_name: str) -> bytes:
+    """Keys and credentials don't change during a run, so download each of them only once per process."""
+    return _get_s3_client().get_object(Bucket=KEYSTORE_S3_BUCKET, Key=file_name)["Body"].read()
+
+
+class KeyStore:  # pylint: disable=too-many-public-methods
     @property
     def s3_client(self) -> S3Client:
-        with BOTO3_CLIENT_CREATION_LOCK:
-            return boto3.client("s3")
+        return _get_s3_client()
 
     def get_file_contents(self, file_name):
-        obj = self.s3.Object(KEYSTORE_S3_BUCKET, file_name)
-        return obj.get()["Body"].read()
+        return _get_file_contents(file_name)
 
     def get_json(self, json_file):
         # deepcode ignore replace~read~decode~json.loads: is done automatically
         return json.loads(self.get_file_contents(json_file))
 
     def download_file(self, filename, dest_filename):
+        # used to sync changed objects to disk (see get_obj_if_needed), so always fetch the current content
         with open(dest_filename, 'wb') as file_obj:
-            file_obj.write(self.get_file_contents(filename))
+            file_obj.write(self.s3_client.get_object(Bucket=KEYSTORE_S3_BUCKET, Key=filename)["Body"].read())
 
     def get_email_credentials(self):
         return self.get_json("email_config.json")
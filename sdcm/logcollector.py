@@ -36,7 +36,7 @@ from sdcm.paths import SCYLLA_YAML_PATH, SCYLLA_PROPERTIES_PATH, SCYLLA_MANAGER_
 from sdcm.provision import provisioner_factory
 from sdcm.provision.network_configuration import ssh_connection_ip_type
 from sdcm.provision.provisioner import ProvisionerError
-from sdcm.remote import RemoteCmdRunnerBase, LocalCmdRunner
+from sdcm.remote import RemoteCmdRunnerBase, LocalCmdRunner, LOCALRUNNER
 from sdcm.remote.libssh2_client import UnexpectedExit as Libssh2_UnexpectedExit
 from sdcm.db_stats import PrometheusDBStats
 from sdcm.sct_events.events_device import EVENTS_LOG_DIR, RAW_EVENTS_LOG
@@ -1631,7 +1631,7 @@ class Collector:  # pylint: disable=too-many-instance-attributes,
                                                   tags={**self.tags, "NodeType": "scylla-db", }))
         self.monitor_set.append(CollectingNode(name=f"monitor-node-{self.test_id}-0",
                                                global_ip='127.0.0.1',
-                                               grafana_ip=get_docker_bridge_gateway(LocalCmdRunner()),
+                                               grafana_ip=get_docker_bridge_gateway(LOCALRUNNER),
                                                tags={**self.tags, "NodeType": "monitor", }))
         for instance in filtered_instances['loader_nodes']:
             self.loader_set.append(CollectingNode(name=instance.name,
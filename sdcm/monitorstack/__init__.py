@@ -12,7 +12,7 @@ from pathlib import Path
 import requests
 import yaml
 
-from sdcm.remote import LocalCmdRunner
+from sdcm.remote import LOCALRUNNER
 from sdcm.utils.common import list_logs_by_test_id, S3Storage, remove_files, get_free_port
 from sdcm.utils.decorators import retrying
 
@@ -172,7 +172,7 @@ def create_monitoring_data_dir(base_dir, archive, tenant_dir=""):
         """.format(data_dir=monitoring_data_base_dir,
                    archive=archive,
                    archive_name=os.path.basename(archive)))
-    result = LocalCmdRunner().run(cmd, timeout=COMMAND_TIMEOUT, ignore_status=True)
+    result = LOCALRUNNER.run(cmd, timeout=COMMAND_TIMEOUT, ignore_status=True)
     if result.exited > 0:
         LOGGER.error("Error during extracting prometheus snapshot. Switch to next archive")
         return False
@@ -186,7 +186,7 @@ def get_nemesis_dashboard_file_for_cluster(base_dir, archive, file_name_for_sear
     # Here we get the correct file name
     cmd = f'tar -tf {archive} | grep "{file_name_for_search}"'
 
-    result = LocalCmdRunner().run(cmd, timeout=COMMAND_TIMEOUT, ignore_status=True)
+    result = LOCALRUNNER.run(cmd, timeout=COMMAND_TIMEOUT, ignore_status=True)
     if result.exited > 0:
         LOGGER.error("Error during extracting monitoring stack")
         return None
@@ -212,7 +212,7 @@ def create_monitoring_stack_dir(base_dir, archive):
                    archive_name=os.path.basename(archive),
                    archive=archive))
 
-    result = LocalCmdRunner().run(cmd, timeout=COMMAND_TIMEOUT, ignore_status=True)
+    result = LOCALRUNNER.run(cmd, timeout=COMMAND_TIMEOUT, ignore_status=True)
     if result.exited > 0:
         LOGGER.error("Error during extracting monitoring stack")
         return False
@@ -280,7 +280,7 @@ def extract_file_from_tar_archive(pattern, archive, extract_dir):
 
 def extract_file_from_tar_zstd(pattern, archive, extract_dir) -> dict[str, str | Path]:
     found_file = {}
-    result = LocalCmdRunner().run(f'tar --zstd -tf {archive}')
+    result = LOCALRUNNER.run(f'tar --zstd -tf {archive}')
     if not result.ok:
         LOGGER.error("Error listing archive contents: %s", result.stderr)
     else:
@@ -290,7 +290,7 @@ def extract_file_from_tar_zstd(pattern, archive, extract_dir) -> dict[str, str |
                 if is_path_outside_of_dir(target_path, extract_dir):
                     LOGGER.warning('Skipping %s file it leads to outside of the target dir', name)
                     continue
-                extract_result = LocalCmdRunner().run(f"tar --zstd -xvf '{archive}' -C '{extract_dir}' '{name}'")
+                extract_result = LOCALRUNNER.run(f"tar --zstd -xvf '{archive}' -C '{extract_dir}' '{name}'")
                 if not extract_result.ok:
                     LOGGER.error("Error extracting file %s: %s", name, extract_result.stderr)
                 else:
@@ -419,7 +419,7 @@ def start_dockers(monitoring_dockers_dir, monitoring_stack_data_dir, scylla_vers
     alert_port = get_free_port(ports_to_try=[ALERT_DOCKER_PORT + i for i in range(tenants_number)] + [0])
     prom_port = get_free_port(ports_to_try=[PROMETHEUS_DOCKER_PORT + i for i in range(tenants_number)] + [0])
 
-    lr = LocalCmdRunner()  # pylint: disable=invalid-name
+    lr = LOCALRUNNER  # pylint: disable=invalid-name
     lr.run('cd {monitoring_dockers_dir}; ./kill-all.sh -g {graf_port} -m {alert_port} -p {prom_port}'.format(**locals()),
            ignore_status=True, verbose=False)
 
@@ -481,7 +481,7 @@ def start_dockers(monitoring_dockers_dir, monitoring_stack_data_dir, scylla_vers
 
 def is_docker_available():
     LOGGER.info("Checking that docker is available...")
-    result = LocalCmdRunner().run('docker ps', ignore_status=True, verbose=False)
+    result = LOCALRUNNER.run('docker ps', ignore_status=True, verbose=False)
     if result.ok:
         LOGGER.info('Docker is available')
         return True
@@ -500,9 +500,9 @@ def verify_monitoring_stack(containers_ports):
 
 
 def verify_dockers_are_running(containers_ports):
-    result = LocalCmdRunner().run("docker ps --format '{{.Names}}'", ignore_status=True)  # pylint: disable=invalid-name
+    result = LOCALRUNNER.run("docker ps --format '{{.Names}}'", ignore_status=True)  # pylint: disable=invalid-name
     docker_names = result.stdout.strip().split()
-    result = LocalCmdRunner().run("docker ps --format '{{.Names}}'", ignore_status=True)  # pylint: disable=invalid-name
+    result = LOCALRUNNER.run("docker ps --format '{{.Names}}'", ignore_status=True)  # pylint: disable=invalid-name
     grafana_docker_port = containers_ports["grafana_docker_port"]
     prometheus_docker_port = containers_ports["prometheus_docker_port"]
     if result.ok and docker_names:
@@ -573,7 +573,7 @@ def kill_running_monitoring_stack_services(ports=None):
                               "prometheus_docker_port": PROMETHEUS_DOCKER_PORT,
                               "alert_docker_port": ALERT_DOCKER_PORT}
 
-    lr = LocalCmdRunner()  # pylint: disable=invalid-name
+    lr = LOCALRUNNER  # pylint: disable=invalid-name
     for docker in get_monitoring_stack_services(ports=dockers_ports):
         LOGGER.info("Killing %s", docker['service'])
         lr.run('docker rm -f {name}-{port}'.format(name=docker['name'], port=docker['port']),
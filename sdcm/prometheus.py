@@ -11,6 +11,7 @@
 #
 # Copyright (c) 2020 ScyllaDB
 
+import os
 import time
 import logging
 import datetime
@@ -34,11 +35,17 @@ STOP = 'stop'
 
 LOGGER = logging.getLogger(__name__)
 NM_OBJ = {}
+METRICS_SERVER_ADDRS = {}  # a forked child doesn't inherit the server thread, so keep an address per PID
+METRICS_SERVER_LOCK = threading.Lock()
 
 
 class _ThreadingSimpleServer(ThreadingMixIn, HTTPServer):
     """Thread per request HTTP server."""
 
+    # Don't keep track of request threads for join on close (a hung scrape shouldn't block the shutdown),
+    # same as prometheus_client's own server.
+    daemon_threads = True
+
 
 def start_http_server(port, addr='', registry=prometheus_client.REGISTRY):
     """Starts an HTTP server for prometheus metrics as a daemon thread"""
@@ -53,16 +60,22 @@ def start_metrics_server():
     """
     https://github.com/prometheus/prometheus/wiki/Default-port-allocations
     Occupied port 9389 for SCT
+
+    All the servers would export the same registry, so start one per process and return its address on next calls.
     """
-    try:
-        LOGGER.debug('Try to start prometheus API server')
-        httpd = start_http_server(0)
-        port = httpd.server_port
-        ip = get_my_ip()
-        LOGGER.info('prometheus API server running on port: %s', port)
-        return '{}:{}'.format(ip, port)
-    except Exception as ex:  # pylint: disable=broad-except  # noqa: BLE001
-        LOGGER.error('Cannot start local http metrics server: %s', ex)
+    with METRICS_SERVER_LOCK:
+        if addr := METRICS_SERVER_ADDRS.get(os.getpid()):
+            return addr
+        try:
+            LOGGER.debug('Try to start prometheus API server')
+            httpd = start_http_server(0)
+            port = httpd.server_port
+            ip = get_my_ip()
+            LOGGER.info('prometheus API server running on port: %s', port)
+            addr = METRICS_SERVER_ADDRS[os.getpid()] = f'{ip}:{port}'
+            return addr
+        except Exception as ex:  # pylint: disable=broad-except  # noqa: BLE001
+            LOGGER.error('Cannot start local http metrics server: %s', ex)
 
     return None
 
@@ -22,7 +22,7 @@ from mypy_boto3_ec2.service_resource import Instance
 
 from sdcm.provision.aws.capacity_reservation import SCTCapacityReservation
 from sdcm.provision.aws.instance_parameters import AWSInstanceParams
-from sdcm.provision.aws.utils import ec2_services, ec2_clients, find_instance_by_id, set_tags_on_instances, \
+from sdcm.provision.aws.utils import ec2_services, ec2_clients, find_instances_by_ids, set_tags_on_instances, \
     wait_for_provision_request_done, create_spot_fleet_instance_request, \
     create_spot_instance_request
 from sdcm.provision.aws.constants import SPOT_CNT_LIMIT, SPOT_FLEET_LIMIT, SPOT_REQUEST_TIMEOUT, STATUS_FULFILLED, \
@@ -198,8 +198,7 @@ class AWSInstanceProvisioner(InstanceProvisionerBase):  # pylint: disable=too-fe
             )
         self._ec2_client(provision_parameters).cancel_spot_fleet_requests(
             SpotFleetRequestIds=[request_id], TerminateInstances=False)
-        return [find_instance_by_id(
-            region_name=provision_parameters.region_name, instance_id=instance_id) for instance_id in instance_ids]
+        return find_instances_by_ids(region_name=provision_parameters.region_name, instance_ids=instance_ids)
 
     def _get_provisioned_fleet_instance_ids(
             self,
@@ -289,5 +288,4 @@ class AWSInstanceProvisioner(InstanceProvisionerBase):  # pylint: disable=too-fe
                 tags={'Name': 'spot_{}_{}'.format(instance_id, ind)} | instance_tags,
             )
         self._ec2_client(provision_parameters).cancel_spot_instance_requests(SpotInstanceRequestIds=request_ids)
-        return [find_instance_by_id(
-            region_name=provision_parameters.region_name, instance_id=instance_id) for instance_id in instance_ids]
+        return find_instances_by_ids(region_name=provision_parameters.region_name, instance_ids=instance_ids)
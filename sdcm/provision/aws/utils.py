@@ -14,11 +14,15 @@
 import abc
 import contextlib
 import datetime
+import threading
 import time
+from copy import deepcopy
+from functools import lru_cache
 from textwrap import dedent
 from typing import Any, Callable, List, Dict, Optional
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from mypy_boto3_ec2 import EC2ServiceResource, EC2Client
 from mypy_boto3_ec2.service_resource import Instance
@@ -28,47 +32,54 @@ from mypy_boto3_ec2.type_defs import InstanceTypeDef, SpotFleetLaunchSpecificati
 from sdcm.provision.aws.constants import SPOT_REQUEST_TIMEOUT, SPOT_REQUEST_WAITING_TIME, STATUS_FULFILLED, \
     SPOT_STATUS_UNEXPECTED_ERROR, SPOT_PRICE_TOO_LOW, FLEET_LIMIT_EXCEEDED_ERROR, SPOT_CAPACITY_NOT_AVAILABLE_ERROR
 from sdcm.provision.common.provisioner import TagsType
+from sdcm.utils.metaclasses import Singleton
 
 
-class Singleton(type):
-    _instances = {}
-
-    def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+# Many threads poll and provision concurrently through the shared per-region clients: let them have enough pooled
+# connections.
+EC2_CLIENT_CONFIG = Config(max_pool_connections=50)
 
 
 class GlobalDictOfInstances(dict, metaclass=Singleton):
+    # boto3 sessions are not thread-safe, so all the clients and resources are created from one session under the lock
+    _session = None
+    _session_lock = threading.RLock()
+
     @abc.abstractmethod
     def _create_instance(self, item: str) -> Any:
         pass
 
-    def __getitem__(self, item: str) -> Any:
-        if item_value := self.get(item, None):
-            return item_value
-        item_value = self._create_instance(item)
-        self[item] = item_value
+    @property
+    def session(self) -> boto3.session.Session:
+        if GlobalDictOfInstances._session is None:
+            GlobalDictOfInstances._session = boto3.session.Session()
+        return GlobalDictOfInstances._session
+
+    def __missing__(self, item: str) -> Any:
+        with self._session_lock:
+            if (item_value := self.get(item)) is None:
+                item_value = self._create_instance(item)
+                dict.__setitem__(self, item, item_value)
         return item_value
 
 
 class Ec2ServicesDict(GlobalDictOfInstances):
     def _create_instance(self, item: str) -> EC2ServiceResource:
-        return boto3.session.Session(region_name=item).resource('ec2')
+        return self.session.resource('ec2', region_name=item, config=EC2_CLIENT_CONFIG)
 
     __getitem__: Callable[[str], EC2ServiceResource]
 
 
 class Ec2ClientsDict(GlobalDictOfInstances):
     def _create_instance(self, item: str) -> EC2Client:
-        return boto3.client(service_name='ec2', region_name=item)
+        return self.session.client(service_name='ec2', region_name=item, config=EC2_CLIENT_CONFIG)
 
     __getitem__: Callable[[str], EC2Client]
 
 
 class Ec2ServiceResourcesDict(GlobalDictOfInstances):
     def _create_instance(self, item: str) -> EC2ServiceResource:
-        return boto3.resource('ec2', region_name=item)
+        return self.session.resource('ec2', region_name=item, config=EC2_CLIENT_CONFIG)
 
     __getitem__: Callable[[str], EC2ServiceResource]
 
@@ -78,9 +89,15 @@ ec2_clients = Ec2ClientsDict()
 ec2_resources = Ec2ServiceResourcesDict()
 
 
+@lru_cache(maxsize=256)
+def _describe_subnet(region_name: str, subnet_id: str):
+    # DescribeSubnets fails with InvalidSubnetID.NotFound for an unknown ID, so the only subnet returned is ours
+    return ec2_clients[region_name].describe_subnets(SubnetIds=[subnet_id])['Subnets'][0]
+
+
 def get_subnet_info(region_name: str, subnet_id: str):
-    resp = ec2_clients[region_name].describe_subnets(SubnetIds=[subnet_id])
-    return [subnet for subnet in resp['Subnets'] if subnet['SubnetId'] == subnet_id][0]
+    """Subnets don't change during a run, so describe each of them once."""
+    return deepcopy(_describe_subnet(region_name=region_name, subnet_id=subnet_id))
 
 
 def convert_tags_to_aws_format(tags: TagsType) -> List[Dict[str, str]]:
@@ -88,58 +105,76 @@ def convert_tags_to_aws_format(tags: TagsType) -> List[Dict[str, str]]:
 
 
 def convert_tags_to_filters(tags: TagsType) -> List[Dict[str, str]]:
-    return [{'Name': 'tag:{}'.format(name), 'Values': value if isinstance(
-        value, list) else [value]} for name, value in tags.items()]
+    return [{'Name': f'tag:{name}', 'Values': value if isinstance(value, list) else [value]}
+            for name, value in tags.items()]
 
 
 def find_instance_descriptions_by_tags(region_name: str, tags: TagsType) -> List[InstanceTypeDef]:
     client: EC2Client = ec2_clients[region_name]
-    response = client.describe_instances(Filters=convert_tags_to_filters(tags))
-    return [instance for reservation in response['Reservations'] for instance in reservation['Instances']]
+    paginator = client.get_paginator('describe_instances')
+    pages = paginator.paginate(Filters=convert_tags_to_filters(tags), PaginationConfig={'PageSize': 1000})
+    return [instance for page in pages for reservation in page['Reservations'] for instance in reservation['Instances']]
 
 
 def find_instances_by_tags(region_name: str, tags: TagsType, states: List[str] = None) -> List[Instance]:
-    instances = []
-    for instance_description in find_instance_descriptions_by_tags(region_name=region_name, tags=tags):
-        if states and instance_description['State']['Name'] not in states:
-            continue
-        instances.append(find_instance_by_id(region_name=region_name, instance_id=instance_description['InstanceId']))
-    return instances
+    instance_ids = [
+        instance_description['InstanceId']
+        for instance_description in find_instance_descriptions_by_tags(region_name=region_name, tags=tags)
+        if not states or instance_description['State']['Name'] in states
+    ]
+    return find_instances_by_ids(region_name=region_name, instance_ids=instance_ids)
 
 
 def find_instance_by_id(region_name: str, instance_id: str) -> Instance:
     return ec2_resources[region_name].Instance(id=instance_id)  # pylint: disable=no-member
 
 
+def find_instances_by_ids(region_name: str, instance_ids: List[str]) -> List[Instance]:
+    """Return loaded instances in the order of `instance_ids', using one DescribeInstances call for all of them."""
+    if not instance_ids:  # an empty InstanceIds filter would match all instances in the region
+        return []
+    try:
+        instances = {
+            instance.id: instance
+            for instance in ec2_resources[region_name].instances.filter(InstanceIds=instance_ids)  # pylint: disable=no-member
+        }
+    except ClientError:  # e.g., InvalidInstanceID.NotFound for just created instances
+        instances = {}
+    # Fall back to a lazy instance for IDs which DescribeInstances doesn't return yet (eventual consistency)
+    return [instances.get(instance_id) or find_instance_by_id(region_name=region_name, instance_id=instance_id)
+            for instance_id in instance_ids]
+
+
 def set_tags_on_instances(region_name: str, instance_ids: List[str], tags: TagsType):
     end_time = time.perf_counter() + 20
-    while end_time > time.perf_counter():
+    delay = 0.5
+    while True:
         with contextlib.suppress(ClientError):
             ec2_clients[region_name].create_tags(  # pylint: disable=no-member
                 Resources=instance_ids,
                 Tags=convert_tags_to_aws_format(tags))
             return True
-    return False
+        # Just created instances can be not visible for a while, back off instead of hammering the API
+        if time.perf_counter() + delay > end_time:
+            return False
+        time.sleep(delay)
+        delay = min(delay * 2, 8)
 
 
 def wait_for_provision_request_done(
         region_name: str, request_ids: List[str], is_fleet: bool,
         timeout: float = SPOT_REQUEST_TIMEOUT,
         wait_interval: float = SPOT_REQUEST_WAITING_TIME):
-    waiting_time = 0
-    provisioned_instance_ids = []
-    while not provisioned_instance_ids and waiting_time < timeout:
+    get_provisioned_instance_ids = get_provisioned_fleet_instance_ids if is_fleet else get_provisioned_spot_instance_ids
+    end_time = time.perf_counter() + timeout
+    while True:
+        # Check right away: a request can be fulfilled (or fail for good) before the first interval passes
+        provisioned_instance_ids = get_provisioned_instance_ids(region_name=region_name, request_ids=request_ids)
+        if provisioned_instance_ids or provisioned_instance_ids is None:
+            return provisioned_instance_ids
+        if time.perf_counter() + wait_interval > end_time:
+            return provisioned_instance_ids
         time.sleep(wait_interval)
-        if is_fleet:
-            provisioned_instance_ids = get_provisioned_fleet_instance_ids(
-                region_name=region_name, request_ids=request_ids)
-        else:
-            provisioned_instance_ids = get_provisioned_spot_instance_ids(
-                region_name=region_name, request_ids=request_ids)
-        if provisioned_instance_ids is None:
-            break
-        waiting_time += wait_interval
-    return provisioned_instance_ids
 
 
 def get_provisioned_fleet_instance_ids(region_name: str, request_ids: List[str]) -> Optional[List[str]]:
@@ -165,12 +200,13 @@ def get_provisioned_fleet_instance_ids(region_name: str, request_ids: List[str])
                     return None
         return []
     provisioned_instances = []
+    paginator = ec2_clients[region_name].get_paginator('describe_spot_fleet_instances')
     for request_id in request_ids:
         try:
-            resp = ec2_clients[region_name].describe_spot_fleet_instances(SpotFleetRequestId=request_id)
+            for page in paginator.paginate(SpotFleetRequestId=request_id):
+                provisioned_instances.extend([inst['InstanceId'] for inst in page['ActiveInstances']])
         except Exception:  # pylint: disable=broad-except  # noqa: BLE001
             return None
-        provisioned_instances.extend([inst['InstanceId'] for inst in resp['ActiveInstances']])
     return provisioned_instances
 
 
@@ -240,11 +276,8 @@ def create_spot_instance_request(
     return [req['SpotInstanceRequestId'] for req in resp['SpotInstanceRequests']]
 
 
-def sort_by_index(item: dict) -> str:
-    for tag in item['Tags']:
-        if tag['Key'] == 'NodeIndex':
-            return tag['Value']
-    return '0'
+def sort_by_index(item: dict) -> int:
+    return int(next((tag['Value'] for tag in item['Tags'] if tag['Key'] == 'NodeIndex'), 0))
 
 
 def network_config_ipv6_workaround_script():
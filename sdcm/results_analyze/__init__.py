@@ -24,14 +24,14 @@ from datetime import datetime, timedelta
 from typing import Any
 from sortedcontainers import SortedDict
 
-import jinja2
+from elasticsearch.helpers import scan
 
 from sdcm.es import ES
 from sdcm.test_config import TestConfig
 from sdcm.db_stats import TestStatsMixin
 from sdcm.send_email import Email, BaseEmailReporter
 from sdcm.sct_events import Severity
-from sdcm.utils.common import format_timestamp
+from sdcm.utils.jinja_utils import get_jinja_env
 from sdcm.utils.es_queries import QueryFilter, PerformanceFilterYCSB, PerformanceFilterScyllaBench, \
     PerformanceFilterCS, CDCQueryFilterCS, LatencyWithNemesisQueryFilter
 from test_lib.utils import MagicList, get_data_by_path
@@ -70,10 +70,13 @@ class BaseResultsAnalyzer:  # pylint: disable=too-many-instance-attributes
         :param test_id: test id created by performance test
         :return: test results in json format
         """
-        if not self._es.exists(index=self._es_index, doc_type=self._es_doc_type, id=test_id):
+        # the nemesis, errors and coredumps reports are the bulk of a test document and none of the analyzers read them
+        doc = self._es.get(index=self._es_index, doc_type=self._es_doc_type, id=test_id,  # pylint: disable=unexpected-keyword-arg
+                           _source_excludes=['nemesis', 'errors', 'coredumps'], ignore=[404])
+        if not doc.get('found'):
             self.log.error('Test results not found: {}'.format(test_id))
             return None
-        return self._es.get(index=self._es_index, doc_type=self._es_doc_type, id=test_id)
+        return doc
 
     @staticmethod
     def _get_grafana_screenshot(test_doc):
@@ -154,13 +157,7 @@ class BaseResultsAnalyzer:  # pylint: disable=too-many-instance-attributes
         """
         email_template_fp = template if template else self._email_template_fp
         self.log.info("Rendering results to html using '%s' template...", email_template_fp)
-        loader = jinja2.FileSystemLoader(os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), '../report_templates'))
-        print(os.path.dirname(os.path.abspath(__file__)))
-        env = jinja2.Environment(loader=loader, autoescape=True, extensions=[
-                                 'jinja2.ext.loopcontrols', 'jinja2.ext.do'])
-        env.filters["format_timestamp"] = format_timestamp
-        template = env.get_template(email_template_fp)
+        template = get_jinja_env().get_template(email_template_fp)
         html = template.render(results)
         self.log.info("Results has been rendered to html")
         if html_file_path:
@@ -680,20 +677,19 @@ class PerformanceResultsAnalyzer(BaseResultsAnalyzer):
 
     @staticmethod
     def _remove_non_stat_keys(stats):
-        for non_stat_key in ['loader_idx', 'cpu_idx', 'keyspace_idx']:
-            if non_stat_key in stats:
-                del stats[non_stat_key]
+        for non_stat_key in ('loader_idx', 'cpu_idx', 'keyspace_idx'):
+            stats.pop(non_stat_key, None)
         return stats
 
     def _test_stats(self, test_doc):
         # check if stats exists
-        if 'results' not in test_doc['_source'] or 'stats_average' not in test_doc['_source']['results'] or \
-                'stats_total' not in test_doc['_source']['results']:
+        results = test_doc['_source'].get('results', {})
+        if 'stats_average' not in results or 'stats_total' not in results:
             self.log.error('Cannot find one of the fields: results, results.stats_average, '
                            'results.stats_total for test id: {}!'.format(test_doc['_id']))
             return None
-        stats_average = self._remove_non_stat_keys(test_doc['_source']['results']['stats_average'])
-        stats_total = test_doc['_source']['results']['stats_total']
+        stats_average = self._remove_non_stat_keys(results['stats_average'])
+        stats_total = results['stats_total']
         if not stats_average or not stats_total or any(stats_average[k] == '' for k in self.PARAMS):
             self.log.error('Cannot find average/total results for test: {}!'.format(test_doc['_id']))
             return None
@@ -784,23 +780,20 @@ class PerformanceResultsAnalyzer(BaseResultsAnalyzer):
             raise ValueError(f'Cannot find query for {doc.get("_id", "unknown test")}')
 
         self.log.debug("Query to ES: %s", query)
-        filter_path = ['hits.hits._id',
-                       'hits.hits._source.results.stats_average',
-                       'hits.hits._source.results.stats_total',
-                       'hits.hits._source.results.throughput',
-                       'hits.hits._source.versions']
-        tests_filtered = self._es.search(index=self._es_index, q=query, filter_path=filter_path,  # pylint: disable=unexpected-keyword-arg
-                                         size=self._limit, request_timeout=30)
-
-        if not tests_filtered:
-            raise ValueError(f'Cannot find tests with the same parameters as {test_id}')
+        source_includes = ['results.stats_average',
+                           'results.stats_total',
+                           'results.throughput',
+                           'versions']
+        # scroll through all the matching tests page by page instead of a single search capped at self._limit
+        tests_filtered = scan(self._es, index=self._es_index, q=query, _source_includes=source_includes,
+                              size=500, request_timeout=30)
 
         # get the best res for all versions of this job
         group_by_version = {}
         # Example:
         # group_by_version = {
         #     "2.3.rc1": {
-        #         "tests": {  # SortedDict(),
+        #         "tests": {
         #             "20180726": {
         #                 "latency 99th percentile": 10.3,
         #                 "op rate": 15034.3
@@ -820,7 +813,9 @@ class PerformanceResultsAnalyzer(BaseResultsAnalyzer):
         #     }
         # }
         # Find best results for each version
-        for row in tests_filtered['hits']['hits']:
+        found_tests = False
+        for row in tests_filtered:
+            found_tests = True
             if row['_id'] == test_id:  # filter the current test
                 continue
             if '_source' not in row:  # non-valid record?
@@ -838,7 +833,7 @@ class PerformanceResultsAnalyzer(BaseResultsAnalyzer):
             version_info_data = {"commit": version_info['commit_id'], "date": formated_version_date}
 
             if version not in group_by_version:
-                group_by_version[version] = {"tests": SortedDict(), "stats_best": {}, "best_test_id": {}}
+                group_by_version[version] = {"tests": {}, "stats_best": {}, "best_test_id": {}}
                 group_by_version[version]['stats_best'] = {k: 0 for k in self.PARAMS}
                 group_by_version[version]['best_test_id'] = {
                     k: version_info_data for k in self.PARAMS}
@@ -855,6 +850,9 @@ class PerformanceResultsAnalyzer(BaseResultsAnalyzer):
                 if k in curr_test_stats and k in old_best and\
                         group_by_version[version]['stats_best'][k] == curr_test_stats[k]:
                     group_by_version[version]['best_test_id'][k] = version_info_data
+        if not found_tests:
+            raise ValueError(f'Cannot find tests with the same parameters as {test_id}')
+
         res_list = []
         # compare with the best in the test version and all the previous versions
         test_version_info = self._test_version(doc)
@@ -865,7 +863,7 @@ class PerformanceResultsAnalyzer(BaseResultsAnalyzer):
                 self.log.info('No previous tests in the current version {} to compare'.format(test_version))
                 continue
             cmp_res = self.cmp(test_stats, group['stats_best'], version, group['best_test_id'])
-            latest_version_test = group["tests"].peekitem(index=-1)[1]
+            latest_version_test = group["tests"][max(group["tests"])]
             latest_res = self.cmp(test_stats,
                                   latest_version_test["test_stats"],
                                   version,
@@ -985,7 +983,7 @@ class PerformanceResultsAnalyzer(BaseResultsAnalyzer):
         # group_by_type = {
         #     "version": {
         #           "sub_type": {
-        #               "tests": {  # SortedDict(),
+        #               "tests": {
         #                   "20180726": {
         #                       "latency 99th percentile": 10.3,
         #                       "op rate": 15034.3
@@ -1044,7 +1042,7 @@ class PerformanceResultsAnalyzer(BaseResultsAnalyzer):
 
             if sub_type not in group_by_version_sub_type[version]:
                 group_by_version_sub_type[version][sub_type] = {
-                    "tests": SortedDict(),
+                    "tests": {},
                     "stats_best": {},
                     "best_test_id": {},
                 }
@@ -213,25 +213,12 @@ def ignore_disk_quota_exceeded_errors(node):
 
 @contextmanager
 def ignore_mutation_write_errors():
-    with ExitStack() as stack:
-        stack.enter_context(EventsSeverityChangerFilter(
-            new_severity=Severity.WARNING,
-            event_class=DatabaseLogEvent,
-            regex=r".*mutation_write_",
-            extra_time_to_expiration=30
-        ))
-        stack.enter_context(EventsSeverityChangerFilter(
-            new_severity=Severity.WARNING,
-            event_class=DatabaseLogEvent,
-            regex=r".*Operation timed out for system.paxos.*",
-            extra_time_to_expiration=30,
-        ))
-        stack.enter_context(EventsSeverityChangerFilter(
-            new_severity=Severity.WARNING,
-            event_class=DatabaseLogEvent,
-            regex=r".*Operation failed for system.paxos.*",
-            extra_time_to_expiration=30,
-        ))
+    with EventsSeverityChangerFilter(
+        new_severity=Severity.WARNING,
+        event_class=DatabaseLogEvent,
+        regex=r".*(mutation_write_|Operation timed out for system.paxos|Operation failed for system.paxos)",
+        extra_time_to_expiration=30,
+    ):
         yield
 
 
@@ -25,10 +25,9 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from functools import cached_property
 
-import jinja2
-
 from sdcm.keystore import KeyStore
-from sdcm.utils.common import list_instances_gce, list_instances_aws, list_resources_docker, format_timestamp
+from sdcm.utils.common import list_instances_gce, list_instances_aws, list_resources_docker
+from sdcm.utils.jinja_utils import get_jinja_env
 from sdcm.utils.gce_utils import gce_public_addresses
 
 LOGGER = logging.getLogger(__name__)
@@ -193,9 +192,7 @@ class BaseEmailReporter:
             current_template = self.email_template_fp
 
         self.log.info("Rendering results to html using '%s' template...", current_template)
-        loader = jinja2.FileSystemLoader(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'report_templates'))
-        env = jinja2.Environment(loader=loader, autoescape=True, extensions=['jinja2.ext.loopcontrols'])
-        env.filters["format_timestamp"] = format_timestamp
+        env = get_jinja_env()
         if template_str is None:
             template = env.get_template(current_template)
         else:
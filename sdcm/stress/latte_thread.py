@@ -33,6 +33,27 @@ from sdcm.utils.docker_remote import RemoteDocker
 
 LOGGER = logging.getLogger(__name__)
 
+LATTE_STATS_REGEX = re.compile(r"""
+    \s*(?P<secoands>\d*\.\d*)
+    \s*(?P<ops>\d*)
+    \s*(?P<reqs>\d*)
+    \s*(?P<min>\d*\.\d*)
+    \s*(?P<p25>\d*\.\d*)
+    \s*(?P<p50>\d*\.\d*)
+    \s*(?P<p75>\d*\.\d*)
+    \s*(?P<p90>\d*\.\d*)
+    \s*(?P<p95>\d*\.\d*)
+    \s*(?P<p99>\d*\.\d*)
+    \s*(?P<p999>\d*\.\d*)
+    \s*(?P<max>\d*\.\d*)\s*
+    """, re.VERBOSE)
+LATTE_SCRIPT_NAME_REGEX = re.compile(r'([/\w-]*\.rn)')
+LATTE_FUNCTION_NAME_REGEX = re.compile(r'.*--function\s*(.*?\S)\s')
+LATTE_OPS_REGEX = re.compile(r'\s*Throughput(.*?)\[op\/s\]\s*(?P<op_rate>\d*)\s')
+LATTE_LATENCY_99_REGEX = re.compile(r'\s* 99 \s*(?P<latency_99th_percentile>\d*\.\d*)\s')
+LATTE_LATENCY_MEAN_REGEX = re.compile(
+    r'\s*(?:Mean resp\. time|Request latency)\s*(?:\[(ms|s)\])?\s*(?P<latency_mean>\d+\.\d+)')
+
 
 class LatteStatsPublisher(FileFollowerThread):
     METRICS = {}
@@ -51,31 +72,16 @@ class LatteStatsPublisher(FileFollowerThread):
             self.METRICS[gauge_name] = metrics.create_gauge(gauge_name,
                                                             'Gauge for latte metrics',
                                                             ['instance', 'loader_idx', 'uuid', 'type'])
+        # resolve the labeled children once, instead of a labels() lookup per value on every line
+        self._labeled_metrics = [
+            self.METRICS[gauge_name].labels(self.loader_node.ip_address, self.loader_idx, self.uuid, name)
+            for name in LATTE_STATS_REGEX.groupindex]
 
     @staticmethod
     def gauge_name(operation):
         return 'sct_latte_%s_gauge' % operation.replace('-', '_')
 
-    def set_metric(self, operation, name, value):
-        metric = self.METRICS[self.gauge_name(operation)]
-        metric.labels(self.loader_node.ip_address, self.loader_idx, self.uuid, name).set(value)
-
     def run(self):
-        regex = re.compile(r"""
-        \s*(?P<secoands>\d*\.\d*)
-        \s*(?P<ops>\d*)
-        \s*(?P<reqs>\d*)
-        \s*(?P<min>\d*\.\d*)
-        \s*(?P<p25>\d*\.\d*)
-        \s*(?P<p50>\d*\.\d*)
-        \s*(?P<p75>\d*\.\d*)
-        \s*(?P<p90>\d*\.\d*)
-        \s*(?P<p95>\d*\.\d*)
-        \s*(?P<p99>\d*\.\d*)
-        \s*(?P<p999>\d*\.\d*)
-        \s*(?P<max>\d*\.\d*)\s*
-        """, re.VERBOSE)
-
         while not self.stopped():
             exists = os.path.isfile(self.latte_log_filename)
             if not exists:
@@ -86,11 +92,9 @@ class LatteStatsPublisher(FileFollowerThread):
                 if self.stopped():
                     break
                 try:
-                    match = regex.search(line)
-                    if match:
-                        for key, _value in match.groupdict().items():
-                            value = float(_value)
-                            self.set_metric(self.operation, key, value)
+                    if match := LATTE_STATS_REGEX.search(line):
+                        for child, value in zip(self._labeled_metrics, match.groups()):
+                            child.set(float(value))
 
                 except Exception:  # pylint: disable=broad-except
                     LOGGER.exception("fail to send metric")
@@ -104,11 +108,9 @@ class LatteStressThread(DockerBasedStressThread):  # pylint: disable=too-many-in
         hosts = " ".join([i.cql_address for i in self.node_list])
 
         # extract the script so we know which files to mount into the docker image
-        script_name_regx = re.compile(r'([/\w-]*\.rn)')
-        script_name = script_name_regx.search(self.stress_cmd).group(0)
+        script_name = LATTE_SCRIPT_NAME_REGEX.search(self.stress_cmd).group(0)
 
-        for src_file in (Path(get_sct_root_path()) / script_name).parent.iterdir():
-            cmd_runner.send_files(str(src_file), str(Path(script_name).parent / src_file.name))
+        cmd_runner.send_files(str((Path(get_sct_root_path()) / script_name).parent), str(Path(script_name).parent))
 
         ssl_config = ''
         if self.params['client_encrypt']:
@@ -163,8 +165,7 @@ class LatteStressThread(DockerBasedStressThread):  # pylint: disable=too-many-in
 
     @staticmethod
     def function_name(stress_cmd):
-        function_name_regex = re.compile(r'.*--function\s*(.*?\S)\s')
-        if match := function_name_regex.match(stress_cmd):
+        if match := LATTE_FUNCTION_NAME_REGEX.match(stress_cmd):
             return match.group(1)
         else:
             return 'read'
@@ -178,23 +179,18 @@ class LatteStressThread(DockerBasedStressThread):  # pylint: disable=too-many-in
         :param result: output of latte stats
         :return: dict
         """
-        ops_regex = re.compile(r'\s*Throughput(.*?)\[op\/s\]\s*(?P<op_rate>\d*)\s')
-        latency_99_regex = re.compile(r'\s* 99 \s*(?P<latency_99th_percentile>\d*\.\d*)\s')
-        latency_mean_regex = re.compile(
-            r'\s*(?:Mean resp\. time|Request latency)\s*(?:\[(ms|s)\])?\s*(?P<latency_mean>\d+\.\d+)')
-
         output = {'latency 99th percentile': 0,
                   'latency mean': 0,
                   'op rate': 0
                   }
         for line in result.stdout.split("SUMMARY STATS")[-1].splitlines():
-            if match := ops_regex.match(line):
+            if match := LATTE_OPS_REGEX.match(line):
                 output['op rate'] = match.groupdict()['op_rate']
                 continue
-            if match := latency_99_regex.match(line):
+            if match := LATTE_LATENCY_99_REGEX.match(line):
                 output['latency 99th percentile'] = float(match.groupdict()['latency_99th_percentile'])
                 continue
-            if match := latency_mean_regex.match(line):
+            if match := LATTE_LATENCY_MEAN_REGEX.match(line):
                 output['latency mean'] = float(match.groupdict()['latency_mean'])
                 continue
 
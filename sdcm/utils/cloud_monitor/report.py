@@ -16,10 +16,8 @@ import tempfile
 from abc import abstractmethod
 
 from datetime import datetime, timedelta
-from collections import defaultdict
-from copy import deepcopy
+from collections import Counter, defaultdict
 
-import jinja2
 import pytz
 
 from sdcm.keystore import KeyStore
@@ -27,6 +25,7 @@ from sdcm.utils.cloud_monitor.resources import CLOUD_PROVIDERS
 from sdcm.utils.cloud_monitor.resources.capacity_reservations import CapacityReservation
 from sdcm.utils.cloud_monitor.resources.instances import CloudInstances
 from sdcm.utils.cloud_monitor.resources.static_ips import StaticIPs
+from sdcm.utils.jinja_utils import get_jinja_env
 
 
 class BaseReport:
@@ -42,10 +41,7 @@ class BaseReport:
         return os.path.join(cur_path, "templates")
 
     def _jinja_render_template(self, **kwargs):
-        loader = jinja2.FileSystemLoader(self.templates_dir)
-        env = jinja2.Environment(loader=loader, autoescape=True, extensions=['jinja2.ext.loopcontrols'],
-                                 finalize=lambda x: x if x != 0 else "")
-        template = env.get_template(self.html_template)
+        template = get_jinja_env(self.templates_dir, hide_zeros=True).get_template(self.html_template)
         html = template.render(**kwargs)
         return html
 
@@ -65,20 +61,19 @@ class BaseReport:
 class CloudResourcesReport(BaseReport):
     def __init__(self, cloud_instances: CloudInstances, static_ips: StaticIPs):
         super().__init__(cloud_instances, static_ips, html_template="cloud_resources.html")
-        stats = dict(num_running_instances=0,
-                     num_stopped_instances=0,
-                     unused_static_ips=0,
-                     num_used_static_ips=0,
-                     )
-        self.report = {cloud_provider: deepcopy(stats) for cloud_provider in CLOUD_PROVIDERS}
+        self.report = {cloud_provider: dict(num_running_instances=0,
+                                            num_stopped_instances=0,
+                                            unused_static_ips=0,
+                                            num_used_static_ips=0,
+                                            )
+                       for cloud_provider in CLOUD_PROVIDERS}
 
     def to_html(self):
         for cloud_provider in CLOUD_PROVIDERS:
-            num_running_instances = len([i for i in self.cloud_instances[cloud_provider] if i.state == "running"])
-            num_stopped_instances = len([i for i in self.cloud_instances[cloud_provider] if i.state == "stopped"])
-            num_unused_static_ips = len([i for i in self.static_ips[cloud_provider] if not i.is_used])
-            self.report[cloud_provider]["num_running_instances"] = num_running_instances
-            self.report[cloud_provider]["num_stopped_instances"] = num_stopped_instances
+            instances_states = Counter(instance.state for instance in self.cloud_instances[cloud_provider])
+            num_unused_static_ips = sum(1 for static_ip in self.static_ips[cloud_provider] if not static_ip.is_used)
+            self.report[cloud_provider]["num_running_instances"] = instances_states["running"]
+            self.report[cloud_provider]["num_stopped_instances"] = instances_states["stopped"]
             self.report[cloud_provider]["num_unused_static_ips"] = num_unused_static_ips
             self.report[cloud_provider]["num_used_static_ips"] = len(self.static_ips[cloud_provider])
         return self.render_template()
@@ -93,29 +88,32 @@ class PerUserSummaryReport(BaseReport):
     def user_type(self, user_name: str):
         return "qa" if user_name in self.qa_users else "others"
 
+    @staticmethod
+    def _new_user_stats():
+        user_stats = {cp: dict(num_running_instances_spot=0, num_running_instances_on_demand=0, num_stopped_instances=0)
+                      for cp in CLOUD_PROVIDERS}
+        user_stats.update(num_instances_keep_alive=0, total_cost=0, projected_daily_cost=0)
+        return user_stats
+
     def to_html(self):
+        results = self.report["results"]
         for cloud_provider in CLOUD_PROVIDERS:
             for instance in self.cloud_instances[cloud_provider]:
-                user_type = self.user_type(instance.owner)
-                results = self.report["results"]
-                if instance.owner not in results[user_type]:
-                    stats = dict(num_running_instances_spot=0, num_running_instances_on_demand=0,
-                                 num_stopped_instances=0)
-                    results[user_type][instance.owner] = {cp: deepcopy(stats) for cp in self.report["cloud_providers"]}
-                    results[user_type][instance.owner]["num_instances_keep_alive"] = 0
-                    results[user_type][instance.owner]["total_cost"] = 0
-                    results[user_type][instance.owner]["projected_daily_cost"] = 0
+                users_stats = results[self.user_type(instance.owner)]
+                if (user_stats := users_stats.get(instance.owner)) is None:
+                    user_stats = users_stats[instance.owner] = self._new_user_stats()
+                cloud_stats = user_stats[cloud_provider]
                 if instance.state == "running":
                     if instance.lifecycle == "spot":
-                        results[user_type][instance.owner][cloud_provider]["num_running_instances_spot"] += 1
+                        cloud_stats["num_running_instances_spot"] += 1
                     else:
-                        results[user_type][instance.owner][cloud_provider]["num_running_instances_on_demand"] += 1
-                    results[user_type][instance.owner]["total_cost"] += instance.total_cost
-                    results[user_type][instance.owner]["projected_daily_cost"] += instance.projected_daily_cost
+                        cloud_stats["num_running_instances_on_demand"] += 1
+                    user_stats["total_cost"] += instance.total_cost
+                    user_stats["projected_daily_cost"] += instance.projected_daily_cost
                 if instance.state == "stopped":
-                    results[user_type][instance.owner][cloud_provider]["num_stopped_instances"] += 1
+                    cloud_stats["num_stopped_instances"] += 1
                 if instance.keep:
-                    results[user_type][instance.owner]["num_instances_keep_alive"] += 1
+                    user_stats["num_instances_keep_alive"] += 1
         return self.render_template()
 
 
@@ -140,10 +138,11 @@ class DetailedReport(BaseReport):
         self.report = defaultdict(list)
 
     def to_html(self):
-        for instance in self.cloud_instances.all:
-            self.report[instance.owner].append(instance)
         if self.user:
-            self.report = {self.user: self.report.get(self.user)}
+            self.report = {self.user: [instance for instance in self.cloud_instances.all if instance.owner == self.user]}
+        else:
+            for instance in self.cloud_instances.all:
+                self.report[instance.owner].append(instance)
         resources_html = self.render_template()
         self.html_template = "base.html"
         return self._jinja_render_template(body=resources_html)
@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import cached_property
 from math import ceil
 
 CLOUD_PROVIDERS = ("aws", "gce", "azure")
@@ -36,11 +37,11 @@ class CloudInstance:  # pylint: disable=too-few-public-methods,too-many-instance
             return ceil(dt_since_created.total_seconds() / 3600)
         return 0
 
-    @property
+    @cached_property
     def total_cost(self):
         return round(self.hours_running() * self.price, 1)
 
-    @property
+    @cached_property
     def projected_daily_cost(self):
         return round(24 * self.price, 1)
 
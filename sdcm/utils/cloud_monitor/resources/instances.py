@@ -1,5 +1,6 @@
 from logging import getLogger
 from datetime import datetime, timezone
+from functools import cache
 
 from boto3 import client as boto3_client
 from azure.mgmt.compute.models import VirtualMachine
@@ -7,8 +8,8 @@ from google.cloud.compute_v1.types import Instance as GceInstance
 
 from sdcm.utils.azure_utils import AzureService
 from sdcm.utils.cloud_monitor.common import InstanceLifecycle, NA
-from sdcm.utils.cloud_monitor.resources import CloudInstance, CloudResources
-from sdcm.utils.common import aws_tags_to_dict, gce_meta_to_dict, list_instances_aws, list_instances_gce
+from sdcm.utils.cloud_monitor.resources import CLOUD_PROVIDERS, CloudInstance, CloudResources
+from sdcm.utils.common import ParallelObject, aws_tags_to_dict, gce_meta_to_dict, list_instances_aws, list_instances_gce
 from sdcm.utils.pricing import AWSPricing, GCEPricing, AzurePricing
 from sdcm.utils.gce_utils import SUPPORTED_PROJECTS
 from sdcm.utils.context_managers import environment
@@ -16,6 +17,11 @@ from sdcm.utils.context_managers import environment
 LOGGER = getLogger(__name__)
 
 
+@cache
+def get_cloudtrail_client(region_name: str):
+    return boto3_client('cloudtrail', region_name=region_name)
+
+
 class AWSInstance(CloudInstance):
     pricing = AWSPricing()
 
@@ -41,7 +47,7 @@ class AWSInstance(CloudInstance):
 
     def get_owner_from_cloud_trail(self):
         try:
-            client = boto3_client('cloudtrail', region_name=self._instance["Placement"]["AvailabilityZone"][:-1])
+            client = get_cloudtrail_client(region_name=self._instance["Placement"]["AvailabilityZone"][:-1])
             result = client.lookup_events(LookupAttributes=[{'AttributeKey': 'ResourceName',
                                                              'AttributeValue': self._instance['InstanceId']}])
             for event in result["Events"]:
@@ -137,7 +143,6 @@ class CloudInstances(CloudResources):
     def get_aws_instances(self):
         aws_instances = list_instances_aws(verbose=True)
         self["aws"] = [AWSInstance(instance) for instance in aws_instances]
-        self.all.extend(self["aws"])
 
     def get_gce_instances(self):
         self["gce"] = []
@@ -145,7 +150,6 @@ class CloudInstances(CloudResources):
             with environment(SCT_GCE_PROJECT=project):
                 gce_instances = list_instances_gce(verbose=True)
                 self["gce"] += [GCEInstance(instance) for instance in gce_instances]
-        self.all.extend(self["gce"])
 
     def get_azure_instances(self):
         query_bits = ["Resources", "where type =~ 'Microsoft.Compute/virtualMachines'",
@@ -155,10 +159,13 @@ class CloudInstances(CloudResources):
         instances = [(get_virtual_machine(resource_group_name=vm["resourceGroup"],
                       vm_name=vm["name"], expand='instanceView'), vm["resourceGroup"]) for vm in res]
         self["azure"] = [AzureInstance(instance, resource_group) for instance, resource_group in instances]
-        self.all.extend(self["azure"])
 
     def get_all(self):
         LOGGER.info("Getting all cloud instances...")
-        self.get_aws_instances()
+        # AWS and Azure are independent of each other, so query them at the same time. GCE switches projects
+        # by changing the process environment, so it's queried only when nothing else runs.
+        getters = [self.get_aws_instances, self.get_azure_instances]
+        ParallelObject(getters, timeout=None, num_workers=len(getters)).call_objects()
         self.get_gce_instances()
-        self.get_azure_instances()
+        for cloud_provider in CLOUD_PROVIDERS:
+            self.all.extend(self[cloud_provider])
@@ -25,7 +25,6 @@ import time
 import datetime
 import errno
 import threading
-import select
 import shutil
 import copy
 import string
@@ -140,10 +139,12 @@ def remote_get_file(remoter, src, dst, hash_expected=None, retries=1, user_agent
     _remote_get_file(remoter, src, dst, user_agent)
     if not hash_expected:
         return
-    while retries > 0 and _remote_get_hash(remoter, dst) != hash_expected:
+    file_hash = _remote_get_hash(remoter, dst)
+    while retries > 0 and file_hash != hash_expected:
         _remote_get_file(remoter, src, dst, user_agent)
         retries -= 1
-    assert _remote_get_hash(remoter, dst) == hash_expected
+        file_hash = _remote_get_hash(remoter, dst)
+    assert file_hash == hash_expected
 
 
 def get_first_view_with_name_like(view_name_substr: str, session) -> tuple:
@@ -231,18 +232,13 @@ def find_file_under_sct_dir(filename: str, sub_folder: str = None):
 def verify_scylla_repo_file(content, is_rhel_like=True):
     LOGGER.info('Verifying Scylla repo file')
     if is_rhel_like:
-        body_prefix = ['#', '[scylla', 'name=', 'baseurl=', 'enabled=', 'gpgcheck=', 'type=',
-                       'skip_if_unavailable=', 'gpgkey=', 'repo_gpgcheck=', 'enabled_metadata=']
+        body_prefix = ('#', '[scylla', 'name=', 'baseurl=', 'enabled=', 'gpgcheck=', 'type=',
+                       'skip_if_unavailable=', 'gpgkey=', 'repo_gpgcheck=', 'enabled_metadata=')
     else:
-        body_prefix = ['#', 'deb']
+        body_prefix = ('#', 'deb')
     for line in content.split('\n'):
-        valid_prefix = False
-        for prefix in body_prefix:
-            if line.startswith(prefix) or not line.strip():
-                valid_prefix = True
-                break
         LOGGER.debug(line)
-        assert valid_prefix, 'Repository content has invalid line: {}'.format(line)
+        assert line.startswith(body_prefix) or not line.strip(), 'Repository content has invalid line: {}'.format(line)
 
 
 class S3Storage():
@@ -742,9 +738,11 @@ def list_instances_aws(tags_dict=None, region_name=None, running=False, group_as
             custom_filter = [{'Name': 'tag:{}'.format(key),
                               'Values': value if isinstance(value, list) else [value]}
                              for key, value in tags_dict.items()]
-        response = client.describe_instances(Filters=custom_filter)
-        instances[region] = [instance for reservation in response['Reservations'] for instance in reservation[
-            'Instances']]
+        paginator = client.get_paginator('describe_instances')
+        instances[region] = [instance
+                             for page in paginator.paginate(Filters=custom_filter, PaginationConfig={'PageSize': 1000})
+                             for reservation in page['Reservations']
+                             for instance in reservation['Instances']]
 
         if verbose:
             LOGGER.info("%s: done [%s/%s]", region, len(list(instances.keys())), len(aws_regions))
@@ -1251,19 +1249,12 @@ class FileFollowerIterator():  # pylint: disable=too-few-public-methods
     def __iter__(self):
         with open(self.filename, encoding="utf-8") as input_file:
             line = ''
-            poller = select.poll()  # pylint: disable=no-member
-            registered = False
             while not self.thread_obj.stopped():
-                if not registered:
-                    poller.register(input_file, select.POLLIN)  # pylint: disable=no-member
-                    registered = True
-                if poller.poll(100):
-                    line += input_file.readline()
-                if not line or not line.endswith('\n'):
+                # regular files always poll as readable, so only back off once we've caught up with the writer
+                line += input_file.readline()
+                if not line.endswith('\n'):
                     time.sleep(0.1)
                     continue
-                poller.unregister(input_file)
-                registered = False
                 yield line
                 line = ''
             yield line
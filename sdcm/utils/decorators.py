@@ -13,6 +13,7 @@
 
 import sys
 import time
+import random
 import logging
 import datetime
 import json
@@ -29,6 +30,8 @@ from sdcm.exceptions import UnsupportedNemesis
 
 LOGGER = logging.getLogger(__name__)
 
+MAX_BACKOFF_SLEEP_TIME = 60  # seconds
+
 
 class Retry(Exception):
     pass
@@ -42,7 +45,7 @@ class retrying:  # pylint: disable=invalid-name,too-few-public-methods
     # pylint: disable=too-many-arguments,redefined-outer-name
     def __init__(self, n=3, sleep_time=1,
                  allowed_exceptions=(Exception,), message="", timeout=0,
-                 raise_on_exceeded=True):
+                 raise_on_exceeded=True, backoff=False):
         if n:
             self.n = n  # number of times to retry  # pylint: disable=invalid-name
         else:
@@ -54,12 +57,18 @@ class retrying:  # pylint: disable=invalid-name,too-few-public-methods
         #   if it is reached even when maximum retries not reached yet
         self.raise_on_exceeded = raise_on_exceeded  # if True - raise exception when number of retries exceeded,
         # otherwise - return None
+        self.backoff = backoff  # if True - double the sleep time after each retry and add a random jitter
+
+    def _get_sleep_time(self, attempt: int) -> float:
+        if not self.backoff:
+            return self.sleep_time
+        return min(self.sleep_time * 2 ** attempt, MAX_BACKOFF_SLEEP_TIME) + random.uniform(0, self.sleep_time)
 
     def __call__(self, func):
         @wraps(func)
         def inner(*args, **kwargs):
             if self.timeout:
-                end_time = time.time() + self.timeout
+                end_time = time.monotonic() + self.timeout
             else:
                 end_time = 0
             if self.n == 1:
@@ -71,12 +80,13 @@ class retrying:  # pylint: disable=invalid-name,too-few-public-methods
                         LOGGER.info("%s [try #%s]", self.message, i)
                     return func(*args, **kwargs)
                 except self.allowed_exceptions as ex:
-                    LOGGER.debug("'%s': failed with '%r', retrying [#%s]", func.__name__, ex, i)
-                    time.sleep(self.sleep_time)
-                    if i == self.n - 1 or (end_time and time.time() > end_time):
-                        LOGGER.error("'%s': Number of retries exceeded!", func.__name__)
+                    if i == self.n - 1 or (end_time and time.monotonic() > end_time):
+                        LOGGER.error("'%s': Number of retries exceeded! Last error: %r", func.__name__, ex)
                         if self.raise_on_exceeded:
                             raise
+                        break
+                    LOGGER.debug("'%s': failed with '%r', retrying [#%s]", func.__name__, ex, i)
+                    time.sleep(self._get_sleep_time(i))
             return None
 
         return inner
@@ -98,7 +98,7 @@ class EnumFunctionalMixin:
                 properties_mapping[prop_name_with_version].append(enum_name)
         setattr(cls, 'properties_mapping', properties_mapping)
         for prop_name, enum_names in properties_mapping.items():
-            setattr(cls, prop_name, property(lambda self, enum_names=enum_names: self.name in enum_names))
+            setattr(cls, prop_name, property(lambda self, enum_names=frozenset(enum_names): self.name in enum_names))
         enum_data['UNKNOWN'] = (None, None)
 
     @property
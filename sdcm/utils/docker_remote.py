@@ -114,6 +114,18 @@ class RemoteDocker(BaseNode):
         return self.node.remoter.run(f"{self.sudo_needed} docker rm -f {self.docker_id}", verbose=False, ignore_status=True)
 
     def send_files(self, src, dst, **kwargs):
+        if Path(src).is_dir():
+            # ship the whole directory with a single transfer and a single `docker cp', instead of file by file
+            remote_tempdir = self.node.remoter.run("mktemp -d", verbose=kwargs.get('verbose')).stdout.strip()
+            try:
+                result = self.node.remoter.send_files(f"{str(src).rstrip('/')}/", f"{remote_tempdir}/", **kwargs)
+                result &= self.run(f'mkdir -p {dst}', ignore_status=True, verbose=kwargs.get('verbose')).ok
+                result &= self.node.remoter.run(
+                    f"{self.sudo_needed} docker cp {remote_tempdir}/. {self.docker_id}:{dst}",
+                    verbose=kwargs.get('verbose'), ignore_status=True).ok
+            finally:
+                self.node.remoter.run(f"rm -rf {remote_tempdir}", verbose=kwargs.get('verbose'), ignore_status=True)
+            return result
         remote_tempfile = self.node.remoter.run("mktemp", verbose=kwargs.get('verbose')).stdout.strip()
         result = self.node.remoter.send_files(src, remote_tempfile, **kwargs)
         result &= self.run(f'mkdir -p {Path(dst).parent}', ignore_status=True, verbose=kwargs.get('verbose')).ok
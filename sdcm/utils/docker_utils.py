@@ -18,7 +18,7 @@ import warnings
 from pprint import pformat
 from types import SimpleNamespace  # pylint: disable=no-name-in-module
 from typing import List, Optional, Union, Any, Tuple, Protocol
-from functools import cache
+from functools import cache, lru_cache
 import itertools
 
 import docker
@@ -498,6 +498,7 @@ def running_in_docker():
         )
 
 
+@lru_cache(maxsize=4)
 def get_docker_bridge_gateway(remoter):
     result = remoter.run(
         "docker inspect -f '{{range .IPAM.Config}}{{.Gateway}}{{end}}' bridge",
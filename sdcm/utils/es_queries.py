@@ -26,12 +26,9 @@ class QueryFilter:
         return ['gce_' + param for param in self.SETUP_INSTANCE_PARAMS] if self.is_gce else self.SETUP_INSTANCE_PARAMS
 
     def filter_setup_details(self):
-        setup_details = ''
-        for param in self.SETUP_PARAMS + self.setup_instance_parameters():
-            if setup_details:
-                setup_details += ' AND '
-            setup_details += 'setup_details.{}: "{}"'.format(param, self.test_doc['_source']['setup_details'][param])
-        return setup_details
+        setup_details = self.test_doc['_source']['setup_details']
+        return ' AND '.join('setup_details.{}: "{}"'.format(param, setup_details[param])
+                            for param in self.SETUP_PARAMS + self.setup_instance_parameters())
 
     def filter_test_details(self):
         test_details = 'test_details.job_name:\"{}\" '.format(
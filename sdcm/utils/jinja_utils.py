@@ -0,0 +1,35 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2024 ScyllaDB
+
+import os
+from functools import cache
+
+import jinja2
+
+from sdcm.utils.common import format_timestamp
+
+REPORT_TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "report_templates")
+
+
+def _hide_zeros(value):
+    return value if value != 0 else ""
+
+
+@cache
+def get_jinja_env(templates_dir: str = REPORT_TEMPLATES_DIR, hide_zeros: bool = False) -> jinja2.Environment:
+    """Return a Jinja environment for `templates_dir', one per process, so compiled templates are reused."""
+    env = jinja2.Environment(loader=jinja2.FileSystemLoader(templates_dir), autoescape=True,
+                             extensions=["jinja2.ext.loopcontrols", "jinja2.ext.do"],
+                             finalize=_hide_zeros if hide_zeros else None)
+    env.filters["format_timestamp"] = format_timestamp
+    return env
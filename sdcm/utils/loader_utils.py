@@ -41,6 +41,10 @@ class LoaderUtilsMixin:
         """
         node = self.db_cluster.nodes[0]
         with self.db_cluster.cql_connection_patient(node) as session:
+            # the table is created once per cluster, but this is called for every counter stress command
+            keyspace = session.cluster.metadata.keyspaces.get('keyspace1')
+            if keyspace and 'counter1' in keyspace.tables:
+                return
             session.execute("""
                 CREATE KEYSPACE IF NOT EXISTS keyspace1
                 WITH replication = {'class': 'NetworkTopologyStrategy', 'replication_factor': 3} AND durable_writes = true;
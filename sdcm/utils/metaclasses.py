@@ -12,10 +12,23 @@
 # Copyright (c) 2021 ScyllaDB
 
 
+import threading
+
+
+_SINGLETON_LOCK = threading.RLock()
+
+
 class Singleton(type):
-    _instances = {}
+    """Construct the instance once, also when several threads ask for it at the same time.
+
+    The instance is kept on the class itself, so the lookup after the first call is a single attribute read.
+    """
 
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+        if (instance := cls.__dict__.get("_singleton_instance")) is not None:
+            return instance
+        with _SINGLETON_LOCK:
+            if (instance := cls.__dict__.get("_singleton_instance")) is None:
+                instance = super().__call__(*args, **kwargs)
+                type.__setattr__(cls, "_singleton_instance", instance)
+        return instance
@@ -54,6 +54,8 @@ from sdcm.utils.gce_utils import (
 
 LOGGER = logging.getLogger('utils')
 
+AWS_TERMINATE_INSTANCES_BATCH_SIZE = 1000  # max number of instance ids per TerminateInstances request
+
 
 def clean_cloud_resources(tags_dict, config=None, dry_run=False):
     """
@@ -152,9 +154,11 @@ def clean_instances_aws(tags_dict: dict, regions=None, dry_run=False):
     assert tags_dict, "tags_dict not provided (can't clean all instances)"
     if regions:
         aws_instances = {}
-        for region in regions:
-            aws_instances |= list_instances_aws(
-                tags_dict=tags_dict, region_name=region, group_as_region=True)
+
+        def list_region_instances(region):
+            aws_instances.update(list_instances_aws(tags_dict=tags_dict, region_name=region, group_as_region=True))
+
+        ParallelObject(regions, timeout=100, num_workers=len(regions)).run(list_region_instances)
     else:
         aws_instances = list_instances_aws(tags_dict=tags_dict, group_as_region=True)
     try:
@@ -163,11 +167,8 @@ def clean_instances_aws(tags_dict: dict, regions=None, dry_run=False):
         LOGGER.warning("Unable to initialize Argus: %s", exc.message)
         argus_client = MagicMock()
 
-    for region, instance_list in aws_instances.items():
-        if not instance_list:
-            LOGGER.info("There are no instances to remove in AWS region %s", region)
-            continue
-        client: EC2Client = boto3.client('ec2', region_name=region)
+    def clean_region_instances(instance_list: list, client: EC2Client):
+        instances_to_terminate = {}
         for instance in instance_list:
             tags = aws_tags_to_dict(instance.get('Tags'))
             name = tags.get("Name", "N/A")
@@ -177,10 +178,27 @@ def clean_instances_aws(tags_dict: dict, regions=None, dry_run=False):
                 LOGGER.info("Skipping Sct Runner instance '%s'", instance_id)
                 continue
             LOGGER.info("Going to delete '{instance_id}' [name={name}] ".format(instance_id=instance_id, name=name))
-            if not dry_run:
-                response = client.terminate_instances(InstanceIds=[instance_id])
-                terminate_resource_in_argus(client=argus_client, resource_name=name)
-                LOGGER.debug("Done. Result: %s\n", response['TerminatingInstances'])
+            instances_to_terminate[instance_id] = name
+        if dry_run:
+            return
+        instance_ids = list(instances_to_terminate)
+        for i in range(0, len(instance_ids), AWS_TERMINATE_INSTANCES_BATCH_SIZE):
+            batch = instance_ids[i:i + AWS_TERMINATE_INSTANCES_BATCH_SIZE]
+            response = client.terminate_instances(InstanceIds=batch)
+            for instance_id in batch:
+                terminate_resource_in_argus(client=argus_client, resource_name=instances_to_terminate[instance_id])
+            LOGGER.debug("Done. Result: %s\n", response['TerminatingInstances'])
+
+    regions_to_clean = []
+    for region, instance_list in aws_instances.items():
+        if not instance_list:
+            LOGGER.info("There are no instances to remove in AWS region %s", region)
+            continue
+        # clients are created here, since creating them from the default boto3 session isn't thread-safe
+        regions_to_clean.append((instance_list, boto3.client('ec2', region_name=region)))
+    if regions_to_clean:
+        ParallelObject(regions_to_clean, timeout=None, num_workers=len(regions_to_clean)).run(
+            clean_region_instances, unpack_objects=True)
 
 
 def clean_elastic_ips_aws(tags_dict, regions=None, dry_run=False):
@@ -0,0 +1,49 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2024 ScyllaDB
+
+from sdcm.cdclog_reader_thread import CDCLogReaderThread
+
+CDCREADER_OUTPUT = """\
+2024/01/01 10:00:00 latency min: 1 ms
+Results:
+num rows read:  95185
+rows read/s:    528.805556/s
+polls/s:        3039.144444/s
+idle polls:     529041/547046 (96.708686%)
+latency min:    0.524288 ms
+latency avg:    11.493153 ms
+latency median: 8.978431 ms
+latency 90%:    22.151167 ms
+latency 99%:    56.328191 ms
+latency 99.9%:  88.604671 ms
+latency max:    156.762111 ms
+"""
+
+
+def test_parse_cdcreaderstressor_results():
+    assert CDCLogReaderThread._parse_cdcreaderstressor_results(CDCREADER_OUTPUT) == {
+        "partition rate": "528.805556",
+        "row rate": "528.805556",
+        "op rate": "3039.144444",
+        "latency min": "0.524288",
+        "latency mean": "11.493153",
+        "latency median": "8.978431",
+        "latency 90th percentile": "22.151167",
+        "latency 99th percentile": "56.328191",
+        "latency 99.9th percentile": "88.604671",
+        "latency max": "156.762111",
+    }
+
+
+def test_parse_cdcreaderstressor_results_without_results_section():
+    assert CDCLogReaderThread._parse_cdcreaderstressor_results("latency min: 1 ms\npolls/s: 10/s\n") == {}
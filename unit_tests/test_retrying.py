@@ -0,0 +1,70 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2024 ScyllaDB
+
+from unittest.mock import patch, call, MagicMock
+
+import pytest
+
+from sdcm.utils.decorators import retrying, MAX_BACKOFF_SLEEP_TIME
+
+
+class DummyException(Exception):
+    pass
+
+
+def failing_func(calls):
+    calls.append(1)
+    raise DummyException("failed")
+
+
+@patch("sdcm.utils.decorators.time")
+def test_no_sleep_after_last_attempt(mock_time):
+    calls = []
+    with pytest.raises(DummyException):
+        retrying(n=3, sleep_time=5)(failing_func)(calls)
+
+    assert len(calls) == 3
+    assert mock_time.sleep.call_args_list == [call(5), call(5)]
+
+
+@patch("sdcm.utils.decorators.time")
+def test_return_none_when_attempts_exceeded(mock_time):
+    calls = []
+
+    assert retrying(n=3, sleep_time=5, raise_on_exceeded=False)(failing_func)(calls) is None
+    assert len(calls) == 3
+    assert mock_time.sleep.call_count == 2
+
+
+@patch("sdcm.utils.decorators.time")
+def test_return_none_when_deadline_reached(mock_time):
+    calls = []
+    mock_time.monotonic = MagicMock(side_effect=[0, 5, 11])
+
+    assert retrying(n=100, sleep_time=5, timeout=10, raise_on_exceeded=False)(failing_func)(calls) is None
+    assert len(calls) == 2
+    assert mock_time.sleep.call_count == 1
+
+
+@patch("sdcm.utils.decorators.random")
+@patch("sdcm.utils.decorators.time")
+def test_backoff_sleep_time_grows_up_to_limit(mock_time, mock_random):
+    mock_random.uniform.return_value = 0
+    calls = []
+    with pytest.raises(DummyException):
+        retrying(n=6, sleep_time=10, backoff=True)(failing_func)(calls)
+
+    assert len(calls) == 6
+    assert mock_time.sleep.call_args_list == [call(10), call(20), call(40),
+                                              call(MAX_BACKOFF_SLEEP_TIME), call(MAX_BACKOFF_SLEEP_TIME)]
+    mock_random.uniform.assert_called_with(0, 10)